@@ -4,12 +4,20 @@ import (
 	"log"
 	"os"
 
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	"github.com/mimir-aip/mimir-aip-go/pkg/workexec"
 )
 
 func main() {
+	logWriter := logging.NewAsyncWriter(os.Stderr, 0)
+	logging.Install(logWriter)
+	defer logging.CloseOnPanic()
+	logging.SetLevel(os.Getenv("LOG_LEVEL"))
+
 	if err := workexec.RunFromEnvironment(); err != nil {
 		log.Printf("Worker failed: %v", err)
+		logWriter.Close()
 		os.Exit(1)
 	}
+	logWriter.Close()
 }
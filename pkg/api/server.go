@@ -6,6 +6,7 @@ import (
 	"log"
 	"net/http"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/google/uuid"
@@ -20,6 +21,10 @@ type taskBroadcastListener struct {
 }
 
 func (l taskBroadcastListener) OnWorkTaskStatusChanged(task *models.WorkTask) {
+	// Nobody is watching: skip encoding the task and queueing a message for the hub.
+	if !l.hub.HasClients() {
+		return
+	}
 	data, err := json.Marshal(map[string]interface{}{
 		"event": "task_update",
 		"task":  task,
@@ -36,6 +41,12 @@ type Server struct {
 	mux             *http.ServeMux
 	workerAuthToken string // if non-empty, required as Bearer token on /api/worktasks/* paths
 	hub             *ws.Hub
+
+	// The OpenAPI registry is filled by init() functions and never changes at
+	// runtime, so the rendered spec is generated once on first request.
+	specOnce sync.Once
+	spec     string
+	specErr  error
 }
 
 // NewServer creates a new API server.
@@ -346,11 +357,13 @@ func (s *Server) handleOpenAPISpec(w http.ResponseWriter, r *http.Request) {
 		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
 		return
 	}
-	spec, err := doc.GenerateSpec()
-	if err != nil {
-		http.Error(w, fmt.Sprintf("Failed to generate spec: %v", err), http.StatusInternalServerError)
+	s.specOnce.Do(func() {
+		s.spec, s.specErr = doc.GenerateSpec()
+	})
+	if s.specErr != nil {
+		http.Error(w, fmt.Sprintf("Failed to generate spec: %v", s.specErr), http.StatusInternalServerError)
 		return
 	}
 	w.Header().Set("Content-Type", "application/yaml")
-	fmt.Fprint(w, spec)
+	fmt.Fprint(w, s.spec)
 }
@@ -8,6 +8,7 @@ import (
 	"time"
 
 	"github.com/mimir-aip/mimir-aip-go/pkg/config"
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
 	"github.com/mimir-aip/mimir-aip-go/pkg/queue"
 	"github.com/mimir-aip/mimir-aip-go/pkg/workexec"
@@ -21,30 +22,38 @@ type LocalBackend struct {
 
 	mu          sync.Mutex
 	active      map[string]struct{}
+	released    chan struct{}
 	workerEnvMu sync.Mutex
 }
 
 // NewLocalBackend creates an in-process execution backend for local mode.
 func NewLocalBackend(q *queue.Queue, cfg *config.Config) *LocalBackend {
 	return &LocalBackend{
-		queue:  q,
-		config: cfg,
-		active: make(map[string]struct{}),
+		queue:    q,
+		config:   cfg,
+		active:   make(map[string]struct{}),
+		released: make(chan struct{}, 1),
 	}
 }
 
 // Run starts the local dispatch loop until the context is cancelled.
+// The loop sleeps until a task is enqueued or a running task frees capacity; the
+// ticker only backstops state changes that are not signalled, such as per-type
+// concurrency slots released by other backends.
 func (lb *LocalBackend) Run(ctx context.Context) {
 	ticker := time.NewTicker(500 * time.Millisecond)
 	defer ticker.Stop()
 
+	lb.processQueue(ctx)
 	for {
 		select {
 		case <-ctx.Done():
 			return
+		case <-lb.queue.Ready():
+		case <-lb.released:
 		case <-ticker.C:
-			lb.processQueue(ctx)
 		}
+		lb.processQueue(ctx)
 	}
 }
 
@@ -91,6 +100,7 @@ func (lb *LocalBackend) processQueue(ctx context.Context) {
 }
 
 func (lb *LocalBackend) runTask(ctx context.Context, task *models.WorkTask) {
+	defer logging.CloseOnPanic()
 	defer lb.unmarkActive(task.ID)
 
 	select {
@@ -158,8 +168,13 @@ func (lb *LocalBackend) markActive(taskID string) {
 
 func (lb *LocalBackend) unmarkActive(taskID string) {
 	lb.mu.Lock()
-	defer lb.mu.Unlock()
 	delete(lb.active, taskID)
+	lb.mu.Unlock()
+
+	select {
+	case lb.released <- struct{}{}:
+	default:
+	}
 }
 
 func restoreEnv(key, value string, existed bool) {
@@ -25,6 +25,7 @@ type ClientConfig struct {
 	CPULimit           string
 	MemoryLimit        string
 	WorkerAuthToken    string // injected as WORKER_AUTH_TOKEN env var in spawned Jobs; empty = disabled
+	LogLevel           string // injected as LOG_LEVEL env var in spawned Jobs; empty = worker default
 }
 
 // Client provides Kubernetes API operations
@@ -36,6 +37,7 @@ type Client struct {
 	cpuLimit           string
 	memoryLimit        string
 	workerAuthToken    string
+	logLevel           string
 	ctx                context.Context
 }
 
@@ -81,6 +83,7 @@ func NewClientWithKubeconfig(cfg ClientConfig, kubeconfigPath string) (*Client,
 		cpuLimit:           cfg.CPULimit,
 		memoryLimit:        cfg.MemoryLimit,
 		workerAuthToken:    cfg.WorkerAuthToken,
+		logLevel:           cfg.LogLevel,
 		ctx:                context.Background(),
 	}, nil
 }
@@ -162,6 +165,14 @@ func (c *Client) CreateWorkerJob(task *models.WorkTask, workerImage string, orch
 		})
 	}
 
+	// Propagate the orchestrator's log level so debug tracing reaches workers
+	if c.logLevel != "" {
+		envVars = append(envVars, corev1.EnvVar{
+			Name:  "LOG_LEVEL",
+			Value: c.logLevel,
+		})
+	}
+
 	// Create Job specification
 	k8sJob := &batchv1.Job{
 		ObjectMeta: metav1.ObjectMeta{
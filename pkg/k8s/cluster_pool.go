@@ -1,7 +1,9 @@
 package k8s
 
 import (
+	"errors"
 	"fmt"
+	"io"
 	"os"
 
 	"gopkg.in/yaml.v3"
@@ -36,8 +38,9 @@ type clusterConfigFile struct {
 }
 
 // NewClusterPool creates a ClusterPool from a slice of ClusterConfig entries.
-// authToken is injected as WORKER_AUTH_TOKEN into every Job spawned by any cluster.
-func NewClusterPool(configs []ClusterConfig, authToken string) (*ClusterPool, error) {
+// authToken is injected as WORKER_AUTH_TOKEN and logLevel as LOG_LEVEL into every
+// Job spawned by any cluster.
+func NewClusterPool(configs []ClusterConfig, authToken, logLevel string) (*ClusterPool, error) {
 	pool := &ClusterPool{authToken: authToken}
 
 	for _, cfg := range configs {
@@ -46,6 +49,7 @@ func NewClusterPool(configs []ClusterConfig, authToken string) (*ClusterPool, er
 			OrchestratorURL:    cfg.OrchestratorURL,
 			ServiceAccountName: cfg.ServiceAccount,
 			WorkerAuthToken:    authToken,
+			LogLevel:           logLevel,
 		}, cfg.Kubeconfig)
 		if err != nil {
 			return nil, fmt.Errorf("cluster %q: %w", cfg.Name, err)
@@ -57,18 +61,19 @@ func NewClusterPool(configs []ClusterConfig, authToken string) (*ClusterPool, er
 }
 
 // LoadClusterPool reads a YAML cluster config file and returns an initialised ClusterPool.
-func LoadClusterPool(path string, authToken string) (*ClusterPool, error) {
-	data, err := os.ReadFile(path)
+func LoadClusterPool(path, authToken, logLevel string) (*ClusterPool, error) {
+	file, err := os.Open(path)
 	if err != nil {
 		return nil, fmt.Errorf("read cluster config file %q: %w", path, err)
 	}
+	defer file.Close()
 
 	var f clusterConfigFile
-	if err := yaml.Unmarshal(data, &f); err != nil {
+	if err := yaml.NewDecoder(file).Decode(&f); err != nil && !errors.Is(err, io.EOF) {
 		return nil, fmt.Errorf("parse cluster config file %q: %w", path, err)
 	}
 
-	return NewClusterPool(f.Clusters, authToken)
+	return NewClusterPool(f.Clusters, authToken, logLevel)
 }
 
 // ActiveWorkerCounts queries each cluster and returns a map of cluster name -> active worker count.
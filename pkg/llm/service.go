@@ -8,6 +8,7 @@ import (
 	"os"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/mimir-aip/mimir-aip-go/pkg/metadatastore"
@@ -18,6 +19,8 @@ import (
 const (
 	modelCacheTTL  = 1 * time.Hour
 	labelBatchSize = 50
+	// maxConcurrentLabelBatches bounds how many label batches are in flight at once.
+	maxConcurrentLabelBatches = 4
 )
 
 // Service wraps a Provider with a TTL model cache and graceful degradation.
@@ -235,6 +238,8 @@ func (s *Service) IsEnabled() bool {
 	if s == nil {
 		return false
 	}
+	s.mu.RLock()
+	defer s.mu.RUnlock()
 	return s.enabled && s.provider != nil
 }
 
@@ -282,7 +287,9 @@ func (s *Service) ListModels(ctx context.Context) ([]Model, error) {
 }
 
 // LabelEntityTypes assigns a PascalCase entity type to each name in names by
-// batching them into groups of labelBatchSize and calling the LLM.
+// batching them into groups of labelBatchSize and calling the LLM. Up to
+// maxConcurrentLabelBatches batches are requested concurrently so large inputs
+// do not pay one round trip after another.
 // It NEVER returns an error — failures are logged and a partial/empty map is
 // returned so the caller can always proceed with heuristic behaviour.
 func (s *Service) LabelEntityTypes(ctx context.Context, names []string, sourceName string, contextCols []string) map[string]string {
@@ -291,18 +298,41 @@ func (s *Service) LabelEntityTypes(ctx context.Context, names []string, sourceNa
 		return result
 	}
 
-	for i := 0; i < len(names); i += labelBatchSize {
-		end := i + labelBatchSize
-		if end > len(names) {
-			end = len(names)
-		}
-		batch := names[i:end]
+	// Snapshot the active provider once so concurrent batches do not race with
+	// SetActiveProvider and every batch is labelled by the same model.
+	s.mu.RLock()
+	provider, model := s.provider, s.defaultModel
+	s.mu.RUnlock()
 
-		labels, err := s.labelBatch(ctx, batch, sourceName, contextCols)
-		if err != nil {
-			log.Printf("llm: LabelEntityTypes batch %d-%d failed: %v", i, end, err)
-			continue
-		}
+	batchCount := (len(names) + labelBatchSize - 1) / labelBatchSize
+	batchLabels := make([]map[string]string, batchCount)
+	sem := make(chan struct{}, maxConcurrentLabelBatches)
+	var wg sync.WaitGroup
+	var failed atomic.Int32
+	for b := 0; b < batchCount; b++ {
+		start := b * labelBatchSize
+		end := min(start+labelBatchSize, len(names))
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(b, start, end int) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			labels, err := labelBatch(ctx, provider, model, names[start:end], sourceName, contextCols)
+			if err != nil {
+				log.Printf("llm: LabelEntityTypes batch %d-%d failed: %v", start, end, err)
+				failed.Add(1)
+				return
+			}
+			batchLabels[b] = labels
+		}(b, start, end)
+	}
+	wg.Wait()
+	if n := failed.Load(); n > 0 {
+		log.Printf("llm: LabelEntityTypes for %s: %d of %d batches failed, returning partial labels", sourceName, n, batchCount)
+	}
+
+	// Merge in batch order so results match the sequential behaviour.
+	for _, labels := range batchLabels {
 		for k, v := range labels {
 			result[k] = v
 		}
@@ -310,9 +340,9 @@ func (s *Service) LabelEntityTypes(ctx context.Context, names []string, sourceNa
 	return result
 }
 
-// labelBatch calls the LLM for a single batch of names and returns the parsed
+// labelBatch calls provider for a single batch of names and returns the parsed
 // entity-type map.
-func (s *Service) labelBatch(ctx context.Context, names []string, sourceName string, contextCols []string) (map[string]string, error) {
+func labelBatch(ctx context.Context, provider Provider, model string, names []string, sourceName string, contextCols []string) (map[string]string, error) {
 	// Build the JSON array of names for the prompt.
 	nameJSON, err := json.Marshal(names)
 	if err != nil {
@@ -328,8 +358,8 @@ No explanations, no markdown, just the raw JSON object.`
 	user := fmt.Sprintf("Source: %s\nContext columns: %s\nEntities: %s",
 		sourceName, colStr, string(nameJSON))
 
-	resp, err := s.provider.Complete(ctx, CompletionRequest{
-		Model: s.defaultModel,
+	resp, err := provider.Complete(ctx, CompletionRequest{
+		Model: model,
 		Messages: []Message{
 			{Role: "system", Content: system},
 			{Role: "user", Content: user},
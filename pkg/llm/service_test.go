@@ -3,8 +3,10 @@ package llm
 import (
 	"context"
 	"errors"
+	"sync"
 	"sync/atomic"
 	"testing"
+	"time"
 )
 
 // ── Mock provider ──────────────────────────────────────────────────────────────
@@ -157,3 +159,75 @@ func TestLabelEntityTypes_InvalidJSON_Degrades(t *testing.T) {
 		t.Errorf("expected empty map on parse failure, got %v", labels)
 	}
 }
+
+func TestLabelEntityTypes_BoundsConcurrentBatchesAndMerges(t *testing.T) {
+	var inFlight, peak, calls atomic.Int32
+	overlapped := make(chan struct{})
+	var overlapOnce sync.Once
+	mock := &mockProvider{
+		name: "mock",
+		complete: func(_ context.Context, req CompletionRequest) (CompletionResponse, error) {
+			calls.Add(1)
+			current := inFlight.Add(1)
+			defer inFlight.Add(-1)
+			for {
+				old := peak.Load()
+				if current <= old || peak.CompareAndSwap(old, current) {
+					break
+				}
+			}
+			if current >= 2 {
+				overlapOnce.Do(func() { close(overlapped) })
+			}
+			// Hold each call until a second batch is in flight; sequential
+			// batching never overlaps and falls through on the timeout.
+			select {
+			case <-overlapped:
+			case <-time.After(time.Second):
+			}
+			if req.Model != "test" {
+				return CompletionResponse{}, errors.New("unexpected model " + req.Model)
+			}
+			return CompletionResponse{Content: `{"shared":"Thing"}`}, nil
+		},
+	}
+	s := NewService(mock, "test", true)
+
+	names := make([]string, labelBatchSize*6)
+	for i := range names {
+		names[i] = "shared"
+	}
+	labels := s.LabelEntityTypes(context.Background(), names, "src", nil)
+
+	if got := calls.Load(); got != 6 {
+		t.Fatalf("expected 6 batch calls, got %d", got)
+	}
+	if got := peak.Load(); got < 2 || got > maxConcurrentLabelBatches {
+		t.Fatalf("expected between 2 and %d concurrent batches, got %d", maxConcurrentLabelBatches, got)
+	}
+	if labels["shared"] != "Thing" {
+		t.Fatalf("expected merged label, got %v", labels)
+	}
+}
+
+func TestLabelEntityTypes_ConcurrentWithSetActiveProvider(t *testing.T) {
+	mock := &mockProvider{name: "mock"}
+	s := NewService(mock, "test", true)
+
+	names := make([]string, labelBatchSize*4)
+	for i := range names {
+		names[i] = "Alice Johnson"
+	}
+
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		for i := 0; i < 50; i++ {
+			s.SetActiveProvider(&mockProvider{name: "other"}, "other-model")
+		}
+	}()
+	for i := 0; i < 5; i++ {
+		s.LabelEntityTypes(context.Background(), names, "src", nil)
+	}
+	<-done
+}
@@ -0,0 +1,32 @@
+package logging
+
+import (
+	"fmt"
+	"log"
+	"strings"
+	"sync/atomic"
+)
+
+var debugEnabled atomic.Bool
+
+// SetLevel applies a configured log level such as LOG_LEVEL. Only "debug"
+// enables Debugf output; every other value leaves the standard logger at its
+// usual info-level verbosity.
+func SetLevel(level string) {
+	debugEnabled.Store(strings.EqualFold(strings.TrimSpace(level), "debug"))
+}
+
+// DebugEnabled reports whether Debugf output is currently emitted. Callers can
+// use it to skip building expensive log arguments.
+func DebugEnabled() bool {
+	return debugEnabled.Load()
+}
+
+// Debugf logs through the standard logger when debug output is enabled. When it
+// is not, the message is never formatted.
+func Debugf(format string, args ...interface{}) {
+	if !debugEnabled.Load() {
+		return
+	}
+	_ = log.Output(2, fmt.Sprintf(format, args...))
+}
@@ -0,0 +1,31 @@
+package logging
+
+import (
+	"bytes"
+	"log"
+	"os"
+	"strings"
+	"testing"
+)
+
+func TestDebugfHonoursLevel(t *testing.T) {
+	var buf bytes.Buffer
+	log.SetOutput(&buf)
+	defer log.SetOutput(os.Stderr)
+	defer SetLevel("info")
+
+	SetLevel("info")
+	Debugf("hidden %d", 1)
+	if buf.Len() != 0 {
+		t.Fatalf("expected no output at info level, got %q", buf.String())
+	}
+
+	SetLevel(" DEBUG ")
+	if !DebugEnabled() {
+		t.Fatal("expected debug to be enabled")
+	}
+	Debugf("shown %d", 2)
+	if !strings.Contains(buf.String(), "shown 2") {
+		t.Fatalf("expected debug output, got %q", buf.String())
+	}
+}
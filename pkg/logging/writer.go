@@ -0,0 +1,125 @@
+// Package logging provides process-wide log output helpers.
+package logging
+
+import (
+	"io"
+	"log"
+	"sync"
+	"sync/atomic"
+)
+
+const (
+	defaultMaxPending = 4096
+	defaultMaxBatch   = 256
+)
+
+// AsyncWriter decouples log producers from the underlying output. Entries are
+// queued on a bounded channel and a single background goroutine coalesces
+// whatever is pending into one Write call on the destination. Producers block
+// once maxPending entries are queued, so a slow destination applies
+// backpressure instead of growing memory without bound.
+type AsyncWriter struct {
+	out      io.Writer
+	entries  chan []byte
+	maxBatch int
+	done     chan struct{}
+
+	mu     sync.RWMutex
+	closed bool
+}
+
+// NewAsyncWriter starts a background writer for out. Non-positive maxPending
+// falls back to a sensible default.
+func NewAsyncWriter(out io.Writer, maxPending int) *AsyncWriter {
+	if maxPending <= 0 {
+		maxPending = defaultMaxPending
+	}
+	w := &AsyncWriter{
+		out:      out,
+		entries:  make(chan []byte, maxPending),
+		maxBatch: defaultMaxBatch,
+		done:     make(chan struct{}),
+	}
+	go w.run()
+	return w
+}
+
+// Write queues a copy of p for the background writer. Once the writer is
+// closed, writes go straight to the destination so late log lines (for example
+// from log.Fatal) are not lost.
+func (w *AsyncWriter) Write(p []byte) (int, error) {
+	w.mu.RLock()
+	defer w.mu.RUnlock()
+	if w.closed {
+		return w.out.Write(p)
+	}
+	// The log package reuses its formatting buffer, so the entry must own its bytes.
+	data := make([]byte, len(p))
+	copy(data, p)
+	w.entries <- data
+	return len(p), nil
+}
+
+// Close drains pending entries and stops the background writer. It returns
+// once everything queued has been written, even when another goroutine is
+// already closing the writer. Subsequent writes are passed through
+// synchronously.
+func (w *AsyncWriter) Close() error {
+	w.mu.Lock()
+	if !w.closed {
+		w.closed = true
+		close(w.entries)
+	}
+	w.mu.Unlock()
+	<-w.done
+	return nil
+}
+
+func (w *AsyncWriter) run() {
+	defer close(w.done)
+	var batch []byte
+	for data := range w.entries {
+		batch = append(batch[:0], data...)
+		for count := 1; count < w.maxBatch; count++ {
+			next, ok := w.nextPending()
+			if !ok {
+				break
+			}
+			batch = append(batch, next...)
+		}
+		_, _ = w.out.Write(batch)
+	}
+}
+
+// nextPending returns the next queued entry without blocking.
+func (w *AsyncWriter) nextPending() ([]byte, bool) {
+	select {
+	case data, ok := <-w.entries:
+		return data, ok
+	default:
+		return nil, false
+	}
+}
+
+// installed is the AsyncWriter set as the standard logger's output by Install.
+var installed atomic.Pointer[AsyncWriter]
+
+// Install makes w the standard logger's output and the writer CloseOnPanic
+// drains.
+func Install(w *AsyncWriter) {
+	log.SetOutput(w)
+	installed.Store(w)
+}
+
+// CloseOnPanic drains the installed AsyncWriter if the calling goroutine is
+// panicking and then re-raises the panic. Defer it at the top of long-running
+// and task goroutines so the log lines leading up to a crash are written before
+// the process dies.
+func CloseOnPanic() {
+	if r := recover(); r != nil {
+		if w := installed.Load(); w != nil {
+			_ = w.Close()
+		}
+		panic(r)
+	}
+}
@@ -0,0 +1,106 @@
+package logging
+
+import (
+	"bytes"
+	"fmt"
+	"log"
+	"os"
+	"strings"
+	"sync"
+	"testing"
+)
+
+type recordingWriter struct {
+	mu     sync.Mutex
+	buf    bytes.Buffer
+	writes int
+}
+
+func (r *recordingWriter) Write(p []byte) (int, error) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	r.writes++
+	return r.buf.Write(p)
+}
+
+func (r *recordingWriter) String() string {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	return r.buf.String()
+}
+
+func TestAsyncWriterPreservesOrder(t *testing.T) {
+	out := &recordingWriter{}
+	w := NewAsyncWriter(out, 8)
+
+	var want strings.Builder
+	for i := 0; i < 100; i++ {
+		line := fmt.Sprintf("line %d\n", i)
+		want.WriteString(line)
+		if _, err := w.Write([]byte(line)); err != nil {
+			t.Fatalf("write failed: %v", err)
+		}
+	}
+	_ = w.Close()
+
+	if got := out.String(); got != want.String() {
+		t.Fatalf("unexpected output after close:\n%s", got)
+	}
+}
+
+func TestAsyncWriterCopiesCallerBuffer(t *testing.T) {
+	out := &recordingWriter{}
+	w := NewAsyncWriter(out, 0)
+
+	buf := []byte("first\n")
+	_, _ = w.Write(buf)
+	copy(buf, "XXXXX\n")
+	_ = w.Close()
+
+	if got := out.String(); got != "first\n" {
+		t.Fatalf("expected queued entry to be independent of caller buffer, got %q", got)
+	}
+}
+
+func TestAsyncWriterWritesThroughAfterClose(t *testing.T) {
+	out := &recordingWriter{}
+	w := NewAsyncWriter(out, 0)
+	_, _ = w.Write([]byte("before\n"))
+	if err := w.Close(); err != nil {
+		t.Fatalf("close failed: %v", err)
+	}
+	_, _ = w.Write([]byte("after\n"))
+
+	if got := out.String(); got != "before\nafter\n" {
+		t.Fatalf("unexpected output: %q", got)
+	}
+}
+
+func TestCloseOnPanicDrainsInstalledWriterFromWorkerGoroutine(t *testing.T) {
+	out := &recordingWriter{}
+	w := NewAsyncWriter(out, 0)
+	Install(w)
+	defer func() {
+		installed.Store(nil)
+		log.SetOutput(os.Stderr)
+	}()
+	log.SetFlags(0)
+	defer log.SetFlags(log.LstdFlags)
+
+	recovered := make(chan interface{}, 1)
+	go func() {
+		// Stands in for the process crashing once the panic leaves the goroutine.
+		defer func() { recovered <- recover() }()
+		defer CloseOnPanic()
+		log.Print("step 1 failed")
+		log.Print("last words")
+		panic("boom")
+	}()
+
+	if r := <-recovered; r != "boom" {
+		t.Fatalf("expected the panic to be re-raised, got %v", r)
+	}
+	if got := out.String(); got != "step 1 failed\nlast words\n" {
+		t.Fatalf("expected queued lines to be written before the panic propagated, got %q", got)
+	}
+}
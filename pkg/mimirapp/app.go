@@ -21,6 +21,7 @@ import (
 	"github.com/mimir-aip/mimir-aip-go/pkg/k8s"
 	"github.com/mimir-aip/mimir-aip-go/pkg/llm"
 	"github.com/mimir-aip/mimir-aip-go/pkg/llm/providers"
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	mcpserver "github.com/mimir-aip/mimir-aip-go/pkg/mcp"
 	"github.com/mimir-aip/mimir-aip-go/pkg/metadatastore"
 	"github.com/mimir-aip/mimir-aip-go/pkg/mlmodel"
@@ -40,6 +41,12 @@ type Options struct {
 }
 
 func Run(cfg *config.Config, options Options) error {
+	logWriter := logging.NewAsyncWriter(os.Stderr, 0)
+	logging.Install(logWriter)
+	defer logWriter.Close()
+	defer logging.CloseOnPanic()
+	logging.SetLevel(cfg.LogLevel)
+
 	log.Printf("Starting Mimir AIP Orchestrator in %s mode", cfg.Environment)
 
 	var (
@@ -48,7 +55,7 @@ func Run(cfg *config.Config, options Options) error {
 	)
 	if cfg.ExecutionMode == config.ExecutionModeKubernetes {
 		if cfg.ClusterConfigFile != "" {
-			clusterPool, err = k8s.LoadClusterPool(cfg.ClusterConfigFile, cfg.WorkerAuthToken)
+			clusterPool, err = k8s.LoadClusterPool(cfg.ClusterConfigFile, cfg.WorkerAuthToken, cfg.LogLevel)
 			if err != nil {
 				return fmt.Errorf("load cluster config %q: %w", cfg.ClusterConfigFile, err)
 			}
@@ -61,7 +68,7 @@ func Run(cfg *config.Config, options Options) error {
 				OrchestratorURL: cfg.OrchestratorURL,
 				MaxWorkers:      cfg.MaxWorkers,
 				ServiceAccount:  cfg.WorkerServiceAccount,
-			}}, cfg.WorkerAuthToken)
+			}}, cfg.WorkerAuthToken, cfg.LogLevel)
 			if err != nil {
 				return fmt.Errorf("initialize kubernetes client: %w", err)
 			}
@@ -190,7 +197,10 @@ func Run(cfg *config.Config, options Options) error {
 	pipelineCompletionBridge.RegisterListener(digitaltwin.NewAutomationListener(automationService, twinProcessor))
 	q.RegisterListener(pipelineCompletionBridge)
 	ensureDefaultTwinProcessingAutomations(dtService, automationService)
-	go dtService.StartCacheEviction(context.Background())
+	go func() {
+		defer logging.CloseOnPanic()
+		dtService.StartCacheEviction(context.Background())
+	}()
 
 	schedulerService.Start()
 	defer schedulerService.Stop()
@@ -209,11 +219,17 @@ func Run(cfg *config.Config, options Options) error {
 	executionCtx, stopExecution := context.WithCancel(context.Background())
 	defer stopExecution()
 	go func() {
+		defer logging.CloseOnPanic()
 		if err := server.Start(); err != nil {
-			log.Fatalf("Failed to start API server: %v", err)
+			log.Printf("Failed to start API server: %v", err)
+			logWriter.Close()
+			os.Exit(1)
 		}
 	}()
-	go backend.Run(executionCtx)
+	go func() {
+		defer logging.CloseOnPanic()
+		backend.Run(executionCtx)
+	}()
 
 	log.Println("Mimir runtime started successfully")
 	sigChan := make(chan os.Signal, 1)
@@ -7,6 +7,7 @@ import (
 	"os"
 	"time"
 
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	"github.com/mimir-aip/mimir-aip-go/pkg/metadatastore"
 	"github.com/mimir-aip/mimir-aip-go/pkg/mlmodel/training"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
@@ -38,6 +39,7 @@ func (m *MonitoringService) Start() {
 	m.done = make(chan struct{})
 	m.ticker = time.NewTicker(1 * time.Hour)
 	go func() {
+		defer logging.CloseOnPanic()
 		for {
 			select {
 			case <-m.ticker.C:
@@ -121,8 +121,12 @@ func FromJSON(data []byte) (*CIR, error) {
 
 // GetDataAsMap attempts to convert the data to a map[string]interface{}
 func (c *CIR) GetDataAsMap() (map[string]interface{}, error) {
-	if m, ok := c.Data.(map[string]interface{}); ok {
-		return m, nil
+	switch v := c.Data.(type) {
+	case map[string]interface{}:
+		return v, nil
+	case []interface{}, string, float64, bool:
+		// Decoded JSON values that can never round-trip into an object.
+		return nil, fmt.Errorf("data is %T, not an object", c.Data)
 	}
 
 	// Try to convert via JSON marshaling/unmarshaling
@@ -141,8 +145,13 @@ func (c *CIR) GetDataAsMap() (map[string]interface{}, error) {
 
 // GetDataAsArray attempts to convert the data to []interface{}
 func (c *CIR) GetDataAsArray() ([]interface{}, error) {
-	if arr, ok := c.Data.([]interface{}); ok {
-		return arr, nil
+	switch v := c.Data.(type) {
+	case []interface{}:
+		return v, nil
+	case map[string]interface{}, string, float64, bool:
+		// Single records are the common case; skip the marshal round-trip
+		// that would only fail.
+		return nil, fmt.Errorf("data is %T, not an array", c.Data)
 	}
 
 	// Try to convert via JSON marshaling/unmarshaling
@@ -225,6 +225,30 @@ func TestCIRGetDataAsArray(t *testing.T) {
 	}
 }
 
+func TestCIRGetDataShapeMismatch(t *testing.T) {
+	single := models.NewCIR(models.SourceTypeAPI, "https://example.com/test", models.DataFormatJSON, map[string]interface{}{"id": "1"})
+	if _, err := single.GetDataAsArray(); err == nil {
+		t.Error("Expected GetDataAsArray() to fail for object data")
+	}
+
+	list := models.NewCIR(models.SourceTypeAPI, "https://example.com/test", models.DataFormatJSON, []interface{}{"a"})
+	if _, err := list.GetDataAsMap(); err == nil {
+		t.Error("Expected GetDataAsMap() to fail for array data")
+	}
+
+	type record struct {
+		ID string `json:"id"`
+	}
+	structured := models.NewCIR(models.SourceTypeAPI, "https://example.com/test", models.DataFormatJSON, record{ID: "1"})
+	m, err := structured.GetDataAsMap()
+	if err != nil {
+		t.Fatalf("GetDataAsMap() error = %v", err)
+	}
+	if m["id"] != "1" {
+		t.Errorf("Expected id=1, got %v", m["id"])
+	}
+}
+
 func TestCIRGetDataAsString(t *testing.T) {
 	data := "test string data"
 
@@ -107,6 +107,22 @@ func (pc *PipelineContext) SetStepData(stepName string, key string, value interf
 	pc.Steps[stepName][key] = value
 }
 
+// SetStepResults merges all values into the data for a specific step, allocating
+// the step's map at most once.
+func (pc *PipelineContext) SetStepResults(stepName string, values map[string]interface{}) {
+	if len(values) == 0 {
+		return
+	}
+	stepData := pc.Steps[stepName]
+	if stepData == nil {
+		stepData = make(map[string]interface{}, len(values))
+		pc.Steps[stepName] = stepData
+	}
+	for key, value := range values {
+		stepData[key] = value
+	}
+}
+
 // GetStepData retrieves data from a specific step
 func (pc *PipelineContext) GetStepData(stepName string, key string) (interface{}, bool) {
 	if stepData, ok := pc.Steps[stepName]; ok {
@@ -14,6 +14,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"text/template"
 	"time"
 
@@ -925,10 +926,20 @@ func (c connectorCheckpoint) toMap() map[string]interface{} {
 
 // ── Template resolution ───────────────────────────────────────────────────────
 
+var (
+	// exactTemplatePattern matches a string that is a single {{...}} expression.
+	exactTemplatePattern = regexp.MustCompile(`^\s*\{\{([^}]+)\}\}\s*$`)
+	// templatePattern matches each {{...}} expression embedded in a string.
+	templatePattern = regexp.MustCompile(`\{\{([^}]+)\}\}`)
+)
+
 // ResolveTemplates resolves {{context.step_name.key}} template variables in a string.
 func (p *DefaultPlugin) ResolveTemplates(input string, ctx *models.PipelineContext) string {
-	exactPattern := regexp.MustCompile(`^\s*\{\{([^}]+)\}\}\s*$`)
-	if matches := exactPattern.FindStringSubmatch(input); len(matches) == 2 {
+	// Most parameters are plain literals; skip both regex passes for them.
+	if !strings.Contains(input, "{{") {
+		return input
+	}
+	if matches := exactTemplatePattern.FindStringSubmatch(input); len(matches) == 2 {
 		expr := strings.TrimSpace(matches[1])
 		if value, ok := p.resolveTemplateValue(expr, ctx); ok {
 			switch typed := value.(type) {
@@ -943,8 +954,7 @@ func (p *DefaultPlugin) ResolveTemplates(input string, ctx *models.PipelineConte
 		}
 	}
 
-	pattern := regexp.MustCompile(`\{\{([^}]+)\}\}`)
-	return pattern.ReplaceAllStringFunc(input, func(match string) string {
+	return templatePattern.ReplaceAllStringFunc(input, func(match string) string {
 		expr := strings.TrimSpace(match[2 : len(match)-2])
 		if value, ok := p.resolveTemplateValue(expr, ctx); ok {
 			return fmt.Sprintf("%v", value)
@@ -954,33 +964,34 @@ func (p *DefaultPlugin) ResolveTemplates(input string, ctx *models.PipelineConte
 }
 
 func (p *DefaultPlugin) resolveTemplateValue(expr string, ctx *models.PipelineContext) (interface{}, bool) {
-	parts := strings.Split(expr, ".")
-	if len(parts) < 2 {
+	// Walk the dotted path with strings.Cut rather than splitting it, so
+	// resolving a reference allocates nothing.
+	head, rest, found := strings.Cut(expr, ".")
+	if !found {
 		return nil, false
 	}
-	if parts[0] != "context" {
+	if head != "context" {
 		return p.evaluateTemplate(expr, ctx), true
 	}
-	if len(parts) < 3 {
+	stepName, rest, found := strings.Cut(rest, ".")
+	if !found {
 		return nil, false
 	}
-
-	stepName := parts[1]
-	key := parts[2]
+	key, rest, more := strings.Cut(rest, ".")
 	value, exists := ctx.GetStepData(stepName, key)
 	if !exists {
 		return nil, false
 	}
 
-	if len(parts) > 3 {
-		for i := 3; i < len(parts); i++ {
-			if m, ok := value.(map[string]interface{}); ok {
-				value, exists = m[parts[i]]
-				if !exists {
-					return nil, false
-				}
-				continue
-			}
+	for more {
+		var field string
+		field, rest, more = strings.Cut(rest, ".")
+		m, ok := value.(map[string]interface{})
+		if !ok {
+			return nil, false
+		}
+		value, exists = m[field]
+		if !exists {
 			return nil, false
 		}
 	}
@@ -988,9 +999,63 @@ func (p *DefaultPlugin) resolveTemplateValue(expr string, ctx *models.PipelineCo
 	return value, true
 }
 
-func (p *DefaultPlugin) evaluateTemplate(expr string, ctx *models.PipelineContext) string {
+// resolveTemplateArray resolves input to an array. A single {{context...}}
+// expression that already holds a decoded array is returned as a shallow copy,
+// so callers may reorder or replace items without touching the stored context;
+// the items themselves are shared and keep their stored types rather than the
+// float64 numbers a JSON round trip would produce. Anything else is rendered and
+// parsed as JSON.
+func (p *DefaultPlugin) resolveTemplateArray(input string, ctx *models.PipelineContext) ([]interface{}, error) {
+	if matches := exactTemplatePattern.FindStringSubmatch(input); len(matches) == 2 {
+		if value, ok := p.resolveTemplateValue(strings.TrimSpace(matches[1]), ctx); ok {
+			if items, isArray := value.([]interface{}); isArray {
+				return append([]interface{}(nil), items...), nil
+			}
+		}
+	}
+	var items []interface{}
+	if err := json.Unmarshal([]byte(p.ResolveTemplates(input, ctx)), &items); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+// maxCachedTemplates bounds exprTemplates; expressions beyond it are parsed on
+// every use.
+const maxCachedTemplates = 512
+
+var (
+	exprTemplatesMu sync.RWMutex
+	// exprTemplates holds parsed non-context expressions. A nil entry records an
+	// expression that failed to parse.
+	exprTemplates = make(map[string]*template.Template)
+)
+
+// exprTemplate returns the parsed template for expr, or nil when it does not
+// parse. Parsed templates are safe to execute concurrently.
+func exprTemplate(expr string) *template.Template {
+	exprTemplatesMu.RLock()
+	tmpl, ok := exprTemplates[expr]
+	exprTemplatesMu.RUnlock()
+	if ok {
+		return tmpl
+	}
+
 	tmpl, err := template.New("expr").Parse("{{" + expr + "}}")
 	if err != nil {
+		tmpl = nil
+	}
+	exprTemplatesMu.Lock()
+	if len(exprTemplates) < maxCachedTemplates {
+		exprTemplates[expr] = tmpl
+	}
+	exprTemplatesMu.Unlock()
+	return tmpl
+}
+
+func (p *DefaultPlugin) evaluateTemplate(expr string, ctx *models.PipelineContext) string {
+	tmpl := exprTemplate(expr)
+	if tmpl == nil {
 		return ""
 	}
 	var buf bytes.Buffer
@@ -1024,9 +1089,8 @@ func (p *DefaultPlugin) resolveArray(raw interface{}, ctx *models.PipelineContex
 	case []interface{}:
 		return v, nil
 	case string:
-		resolved := p.ResolveTemplates(v, ctx)
-		var items []interface{}
-		if err := json.Unmarshal([]byte(resolved), &items); err != nil {
+		items, err := p.resolveTemplateArray(v, ctx)
+		if err != nil {
 			return nil, fmt.Errorf("items must resolve to a JSON array: %w", err)
 		}
 		return items, nil
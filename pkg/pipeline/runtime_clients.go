@@ -2,12 +2,14 @@ package pipeline
 
 import (
 	"bytes"
+	"container/list"
 	"encoding/json"
 	"fmt"
 	"io"
 	"net/http"
 	"net/url"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
@@ -50,20 +52,119 @@ func (c *HTTPStorageClient) Store(storageID string, cir *models.CIR) (*models.St
 	return &result, nil
 }
 
+const (
+	// checkpointCacheSize bounds the number of checkpoints a worker keeps in memory.
+	checkpointCacheSize = 256
+	// checkpointCacheTTL bounds how stale a cached checkpoint may be. It covers bursts
+	// of loads within one step without hiding resets or edits made outside the run
+	// from pipelines that loop and poll.
+	checkpointCacheTTL = 5 * time.Second
+)
+
 // HTTPCheckpointStore persists step checkpoints through the orchestrator pipeline API.
+// Responses are kept in a small LRU so repeated loads of the same checkpoint within a
+// worker run (for example inside for_each) do not each cost a round trip. Cached loads
+// may therefore be up to checkpointCacheTTL behind the orchestrator. Saves made through
+// the store refresh the cached copy; a failed save evicts it so the next load observes
+// the orchestrator's version. Saves are always sent, so the orchestrator's version
+// check sees every write.
 type HTTPCheckpointStore struct {
 	baseURL string
 	client  *http.Client
+
+	mu    sync.Mutex
+	ttl   time.Duration
+	cache map[string]*list.Element
+	order *list.List
+}
+
+type checkpointCacheEntry struct {
+	key     string
+	body    []byte // nil when the checkpoint is known not to exist
+	expires time.Time
 }
 
 func NewHTTPCheckpointStore(baseURL string) *HTTPCheckpointStore {
 	return &HTTPCheckpointStore{
 		baseURL: strings.TrimRight(baseURL, "/"),
 		client:  &http.Client{Timeout: 30 * time.Second},
+		ttl:     checkpointCacheTTL,
+		cache:   make(map[string]*list.Element),
+		order:   list.New(),
+	}
+}
+
+func checkpointCacheKey(projectID, pipelineID, stepName, scope string) string {
+	return strings.Join([]string{projectID, pipelineID, stepName, scope}, "\x00")
+}
+
+func (c *HTTPCheckpointStore) cached(key string) (checkpointCacheEntry, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	elem, ok := c.cache[key]
+	if !ok {
+		return checkpointCacheEntry{}, false
+	}
+	entry := elem.Value.(*checkpointCacheEntry)
+	if !time.Now().Before(entry.expires) {
+		c.order.Remove(elem)
+		delete(c.cache, key)
+		return checkpointCacheEntry{}, false
+	}
+	c.order.MoveToFront(elem)
+	return *entry, true
+}
+
+// remember caches body for key. A nil body records that the checkpoint does not exist.
+func (c *HTTPCheckpointStore) remember(key string, body []byte) {
+	entry := &checkpointCacheEntry{key: key, body: body}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	entry.expires = time.Now().Add(c.ttl)
+	if elem, ok := c.cache[key]; ok {
+		elem.Value = entry
+		c.order.MoveToFront(elem)
+		return
+	}
+	c.cache[key] = c.order.PushFront(entry)
+	if c.order.Len() > checkpointCacheSize {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.cache, oldest.Value.(*checkpointCacheEntry).key)
+	}
+}
+
+func (c *HTTPCheckpointStore) forget(key string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if elem, ok := c.cache[key]; ok {
+		c.order.Remove(elem)
+		delete(c.cache, key)
 	}
 }
 
+func decodeCheckpoint(body []byte) (*models.PipelineCheckpoint, error) {
+	var checkpoint models.PipelineCheckpoint
+	if err := json.Unmarshal(body, &checkpoint); err != nil {
+		return nil, err
+	}
+	return &checkpoint, nil
+}
+
 func (c *HTTPCheckpointStore) GetPipelineCheckpoint(projectID, pipelineID, stepName, scope string) (*models.PipelineCheckpoint, error) {
+	key := checkpointCacheKey(projectID, pipelineID, stepName, scope)
+	if entry, ok := c.cached(key); ok {
+		if entry.body == nil {
+			return nil, nil
+		}
+		// Decode on every hit so callers never share mutable checkpoint maps.
+		if checkpoint, err := decodeCheckpoint(entry.body); err == nil {
+			return checkpoint, nil
+		}
+		c.forget(key)
+	}
+
 	query := url.Values{}
 	query.Set("step_name", stepName)
 	if scope != "" {
@@ -80,6 +181,7 @@ func (c *HTTPCheckpointStore) GetPipelineCheckpoint(projectID, pipelineID, stepN
 	defer resp.Body.Close()
 
 	if resp.StatusCode == http.StatusNotFound {
+		c.remember(key, nil)
 		return nil, nil
 	}
 	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
@@ -87,11 +189,16 @@ func (c *HTTPCheckpointStore) GetPipelineCheckpoint(projectID, pipelineID, stepN
 		return nil, fmt.Errorf("checkpoint API returned %d: %s", resp.StatusCode, strings.TrimSpace(string(respBody)))
 	}
 
-	var checkpoint models.PipelineCheckpoint
-	if err := json.NewDecoder(resp.Body).Decode(&checkpoint); err != nil {
+	body, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read checkpoint response: %w", err)
+	}
+	checkpoint, err := decodeCheckpoint(body)
+	if err != nil {
 		return nil, fmt.Errorf("failed to decode checkpoint response: %w", err)
 	}
-	return &checkpoint, nil
+	c.remember(key, body)
+	return checkpoint, nil
 }
 
 func (c *HTTPCheckpointStore) SavePipelineCheckpoint(checkpoint *models.PipelineCheckpoint) error {
@@ -119,21 +226,31 @@ func (c *HTTPCheckpointStore) SavePipelineCheckpoint(checkpoint *models.Pipeline
 	}
 	req.Header.Set("Content-Type", "application/json")
 
+	key := checkpointCacheKey(checkpoint.ProjectID, checkpoint.PipelineID, checkpoint.StepName, checkpoint.Scope)
 	resp, err := c.client.Do(req)
 	if err != nil {
+		c.forget(key)
 		return fmt.Errorf("failed to save checkpoint: %w", err)
 	}
 	defer resp.Body.Close()
 
 	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
+		c.forget(key)
 		respBody, _ := io.ReadAll(resp.Body)
 		return fmt.Errorf("checkpoint API returned %d: %s", resp.StatusCode, strings.TrimSpace(string(respBody)))
 	}
 
-	var persisted models.PipelineCheckpoint
-	if err := json.NewDecoder(resp.Body).Decode(&persisted); err != nil {
+	respBody, err := io.ReadAll(resp.Body)
+	if err != nil {
+		c.forget(key)
+		return fmt.Errorf("failed to read saved checkpoint: %w", err)
+	}
+	persisted, err := decodeCheckpoint(respBody)
+	if err != nil {
+		c.forget(key)
 		return fmt.Errorf("failed to decode saved checkpoint: %w", err)
 	}
-	*checkpoint = persisted
+	c.remember(key, respBody)
+	*checkpoint = *persisted
 	return nil
 }
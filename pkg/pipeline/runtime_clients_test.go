@@ -0,0 +1,182 @@
+package pipeline
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/mimir-aip/mimir-aip-go/pkg/models"
+)
+
+func TestHTTPCheckpointStore_CachesLoadsAndRefreshesOnSave(t *testing.T) {
+	var gets, puts int32
+	var stored *models.PipelineCheckpoint
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		switch r.Method {
+		case http.MethodGet:
+			atomic.AddInt32(&gets, 1)
+			if stored == nil {
+				http.NotFound(w, r)
+				return
+			}
+			_ = json.NewEncoder(w).Encode(stored)
+		case http.MethodPut:
+			atomic.AddInt32(&puts, 1)
+			var incoming models.PipelineCheckpoint
+			if err := json.NewDecoder(r.Body).Decode(&incoming); err != nil {
+				http.Error(w, err.Error(), http.StatusBadRequest)
+				return
+			}
+			incoming.Version++
+			incoming.UpdatedAt = time.Now().UTC()
+			stored = &incoming
+			_ = json.NewEncoder(w).Encode(stored)
+		}
+	}))
+	defer server.Close()
+
+	store := NewHTTPCheckpointStore(server.URL)
+
+	for i := 0; i < 3; i++ {
+		checkpoint, err := store.GetPipelineCheckpoint("proj", "pipe", "poll", "")
+		if err != nil {
+			t.Fatalf("load %d failed: %v", i, err)
+		}
+		if checkpoint != nil {
+			t.Fatalf("expected no checkpoint yet, got %#v", checkpoint)
+		}
+	}
+	if gets != 1 {
+		t.Fatalf("expected a single GET for repeated misses, got %d", gets)
+	}
+
+	saved := &models.PipelineCheckpoint{
+		ProjectID:  "proj",
+		PipelineID: "pipe",
+		StepName:   "poll",
+		Checkpoint: map[string]interface{}{"cursor": "a"},
+	}
+	if err := store.SavePipelineCheckpoint(saved); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+	if saved.Version != 1 {
+		t.Fatalf("expected persisted version 1, got %d", saved.Version)
+	}
+
+	first, err := store.GetPipelineCheckpoint("proj", "pipe", "poll", "")
+	if err != nil {
+		t.Fatalf("load after save failed: %v", err)
+	}
+	if first == nil || first.Version != 1 || first.Checkpoint["cursor"] != "a" {
+		t.Fatalf("expected saved checkpoint from cache, got %#v", first)
+	}
+	first.Checkpoint["cursor"] = "mutated"
+
+	second, err := store.GetPipelineCheckpoint("proj", "pipe", "poll", "")
+	if err != nil {
+		t.Fatalf("second load after save failed: %v", err)
+	}
+	if second.Checkpoint["cursor"] != "a" {
+		t.Fatalf("expected cached checkpoint to be isolated from callers, got %#v", second.Checkpoint)
+	}
+	if gets != 1 || puts != 1 {
+		t.Fatalf("expected 1 GET and 1 PUT, got %d and %d", gets, puts)
+	}
+}
+
+func TestHTTPCheckpointStore_UnchangedSaveStillDetectsConflict(t *testing.T) {
+	var puts int32
+	var serverVersion int32
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method != http.MethodPut {
+			http.NotFound(w, r)
+			return
+		}
+		atomic.AddInt32(&puts, 1)
+		var incoming models.PipelineCheckpoint
+		if err := json.NewDecoder(r.Body).Decode(&incoming); err != nil {
+			http.Error(w, err.Error(), http.StatusBadRequest)
+			return
+		}
+		if int32(incoming.Version) != atomic.LoadInt32(&serverVersion) {
+			http.Error(w, "checkpoint version conflict", http.StatusConflict)
+			return
+		}
+		incoming.Version = int(atomic.AddInt32(&serverVersion, 1))
+		w.Header().Set("Content-Type", "application/json")
+		_ = json.NewEncoder(w).Encode(incoming)
+	}))
+	defer server.Close()
+
+	store := NewHTTPCheckpointStore(server.URL)
+	save := func(version int, cursor string) (*models.PipelineCheckpoint, error) {
+		checkpoint := &models.PipelineCheckpoint{
+			ProjectID:  "proj",
+			PipelineID: "pipe",
+			StepName:   "poll",
+			Version:    version,
+			Checkpoint: map[string]interface{}{"cursor": cursor},
+		}
+		return checkpoint, store.SavePipelineCheckpoint(checkpoint)
+	}
+
+	first, err := save(0, "a")
+	if err != nil {
+		t.Fatalf("first save failed: %v", err)
+	}
+
+	// Another writer moves the checkpoint on; re-saving our unchanged data must not
+	// be mistaken for a successful write.
+	atomic.AddInt32(&serverVersion, 1)
+	if _, err := save(first.Version, "a"); err == nil {
+		t.Fatal("expected unchanged save against a newer server version to conflict")
+	}
+	if puts != 2 {
+		t.Fatalf("expected the unchanged save to be sent, got %d PUTs", puts)
+	}
+}
+
+func TestHTTPCheckpointStore_CachedLoadsExpire(t *testing.T) {
+	var gets int32
+	var cursor atomic.Value
+	cursor.Store("a")
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&gets, 1)
+		w.Header().Set("Content-Type", "application/json")
+		_ = json.NewEncoder(w).Encode(models.PipelineCheckpoint{
+			ProjectID:  "proj",
+			PipelineID: "pipe",
+			StepName:   "poll",
+			Version:    1,
+			Checkpoint: map[string]interface{}{"cursor": cursor.Load()},
+		})
+	}))
+	defer server.Close()
+
+	store := NewHTTPCheckpointStore(server.URL)
+	store.ttl = 20 * time.Millisecond
+
+	load := func() *models.PipelineCheckpoint {
+		t.Helper()
+		checkpoint, err := store.GetPipelineCheckpoint("proj", "pipe", "poll", "")
+		if err != nil {
+			t.Fatalf("load failed: %v", err)
+		}
+		return checkpoint
+	}
+
+	load()
+	// An edit made outside the run is hidden only until the cached entry expires.
+	cursor.Store("reset")
+	if got := load(); got.Checkpoint["cursor"] != "a" || gets != 1 {
+		t.Fatalf("expected cached checkpoint within the ttl, got %#v after %d GETs", got.Checkpoint, gets)
+	}
+	time.Sleep(30 * time.Millisecond)
+	if got := load(); got.Checkpoint["cursor"] != "reset" || gets != 2 {
+		t.Fatalf("expected expired entry to be refetched, got %#v after %d GETs", got.Checkpoint, gets)
+	}
+}
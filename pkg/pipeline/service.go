@@ -1,13 +1,13 @@
 package pipeline
 
 import (
-	"encoding/json"
 	"fmt"
 	"log"
 	"strings"
 	"time"
 
 	"github.com/google/uuid"
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	"github.com/mimir-aip/mimir-aip-go/pkg/metadatastore"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
 	"github.com/mimir-aip/mimir-aip-go/pkg/pluginruntime"
@@ -263,9 +263,22 @@ func (s *Service) Execute(pipelineID string, req *models.PipelineExecutionReques
 	execution.Context.SetStepData("_runtime", "pipeline_id", pipeline.ID)
 	execution.Context.SetStepData("_runtime", "trigger_type", req.TriggerType)
 
+	// Resolve every plugin the pipeline references once, up front, so steps and
+	// for_each iterations use a plain map lookup instead of the registries. The
+	// default plugin is always bound because it resolves output templates and
+	// for_each items.
+	plugins := make(pluginTable)
+	if dp, ok := s.plugins.Get("default"); ok {
+		plugins["default"] = dp
+	}
+	plugins = s.resolvePlugins(pipeline.Steps, plugins)
+
 	// Execute pipeline steps
 	log.Printf("Executing pipeline %s (%s) - %d steps", pipeline.Name, pipeline.ID, len(pipeline.Steps))
 
+	// stepIndex is built on the first goto so looping pipelines resolve jump
+	// targets without rescanning the step list on every iteration.
+	var stepIndex map[string]int
 	currentStepIndex := 0
 	for currentStepIndex < len(pipeline.Steps) {
 		step := pipeline.Steps[currentStepIndex]
@@ -273,13 +286,9 @@ func (s *Service) Execute(pipelineID string, req *models.PipelineExecutionReques
 		// for_each: iterate over a collection and execute sub-steps for each item
 		if step.ForEach != nil {
 			log.Printf("  Step %d: %s (for_each)", currentStepIndex+1, step.Name)
-			count, err := s.executeForEach(step, execution, pipeline.Steps)
+			count, err := s.executeForEach(step, execution, plugins)
 			if err != nil {
-				execution.Status = "failed"
-				execution.Error = fmt.Sprintf("step %s failed: %v", step.Name, err)
-				now := time.Now()
-				execution.CompletedAt = &now
-				return execution, fmt.Errorf("step %s failed: %w", step.Name, err)
+				return failExecution(execution, fmt.Errorf("step %s failed: %w", step.Name, err))
 			}
 			execution.Context.SetStepData(step.Name, "count", count)
 			currentStepIndex++
@@ -288,36 +297,23 @@ func (s *Service) Execute(pipelineID string, req *models.PipelineExecutionReques
 
 		log.Printf("  Step %d: %s (%s.%s)", currentStepIndex+1, step.Name, step.Plugin, step.Action)
 
-		result, gotoTarget, err := s.executeStep(step, execution.Context)
+		result, gotoTarget, err := s.executeStep(step, execution.Context, plugins)
 		if err != nil {
-			execution.Status = "failed"
-			execution.Error = fmt.Sprintf("step %s failed: %v", step.Name, err)
-			now := time.Now()
-			execution.CompletedAt = &now
 			log.Printf("    Error: %v", err)
-			return execution, fmt.Errorf("step %s failed: %w", step.Name, err)
+			return failExecution(execution, fmt.Errorf("step %s failed: %w", step.Name, err))
 		}
 
 		// Store step results in context
-		for key, value := range result {
-			execution.Context.SetStepData(step.Name, key, value)
-		}
+		execution.Context.SetStepResults(step.Name, result)
 
 		// Check for goto action
 		if gotoTarget != "" {
-			targetIndex := -1
-			for i, s := range pipeline.Steps {
-				if s.Name == gotoTarget {
-					targetIndex = i
-					break
-				}
+			if stepIndex == nil {
+				stepIndex = IndexSteps(pipeline.Steps)
 			}
-			if targetIndex == -1 {
-				execution.Status = "failed"
-				execution.Error = fmt.Sprintf("goto target not found: %s", gotoTarget)
-				now := time.Now()
-				execution.CompletedAt = &now
-				return execution, fmt.Errorf("goto target not found: %s", gotoTarget)
+			targetIndex, found := stepIndex[gotoTarget]
+			if !found {
+				return failExecution(execution, fmt.Errorf("goto target not found: %s", gotoTarget))
 			}
 			log.Printf("    Jumping to step: %s", gotoTarget)
 			currentStepIndex = targetIndex
@@ -337,14 +333,69 @@ func (s *Service) Execute(pipelineID string, req *models.PipelineExecutionReques
 	return execution, nil
 }
 
-// executeStep runs a single pipeline step, returning its result map and any goto target.
-func (s *Service) executeStep(step models.PipelineStep, ctx *models.PipelineContext) (map[string]interface{}, string, error) {
-	ctx.SetStepData("_runtime", "current_step", step.Name)
+// failExecution marks execution as failed with err and returns both, so every
+// failure path in Execute records the same status, message and completion time.
+func failExecution(execution *models.PipelineExecution, err error) (*models.PipelineExecution, error) {
+	execution.Status = "failed"
+	execution.Error = err.Error()
+	now := time.Now()
+	execution.CompletedAt = &now
+	return execution, err
+}
 
-	plugin, ok := s.plugins.Get(step.Plugin)
+// IndexSteps maps each step name to its position. When names repeat, the first
+// occurrence wins, matching how goto targets have always been resolved.
+func IndexSteps(steps []models.PipelineStep) map[string]int {
+	index := make(map[string]int, len(steps))
+	for i := len(steps) - 1; i >= 0; i-- {
+		index[steps[i].Name] = i
+	}
+	return index
+}
+
+// pluginTable maps the plugin names referenced by one pipeline to their instances.
+type pluginTable map[string]Plugin
+
+// templates returns the bound default plugin, which resolves {{...}} templates.
+func (t pluginTable) templates() (*DefaultPlugin, bool) {
+	dp, ok := t["default"].(*DefaultPlugin)
+	return dp, ok
+}
+
+// lookupPlugin resolves a plugin by name from the service registry, falling back
+// to the external plugin registry when one is configured.
+func (s *Service) lookupPlugin(name string) (Plugin, bool) {
+	plugin, ok := s.plugins.Get(name)
 	if !ok && s.pluginRegistry != nil {
-		plugin, ok = s.pluginRegistry.GetPlugin(step.Plugin)
+		plugin, ok = s.pluginRegistry.GetPlugin(name)
+	}
+	return plugin, ok
+}
+
+// resolvePlugins adds every plugin referenced by steps, including for_each
+// sub-steps, to table. Unknown plugins are left out so the step that uses them
+// fails when it is reached, as before.
+func (s *Service) resolvePlugins(steps []models.PipelineStep, table pluginTable) pluginTable {
+	for _, step := range steps {
+		if step.ForEach != nil {
+			s.resolvePlugins(step.ForEach.Steps, table)
+			continue
+		}
+		if _, seen := table[step.Plugin]; seen {
+			continue
+		}
+		if plugin, ok := s.lookupPlugin(step.Plugin); ok {
+			table[step.Plugin] = plugin
+		}
 	}
+	return table
+}
+
+// executeStep runs a single pipeline step, returning its result map and any goto target.
+func (s *Service) executeStep(step models.PipelineStep, ctx *models.PipelineContext, plugins pluginTable) (map[string]interface{}, string, error) {
+	ctx.SetStepData("_runtime", "current_step", step.Name)
+
+	plugin, ok := plugins[step.Plugin]
 	if !ok {
 		return nil, "", fmt.Errorf("unknown plugin: %s", step.Plugin)
 	}
@@ -356,13 +407,12 @@ func (s *Service) executeStep(step models.PipelineStep, ctx *models.PipelineCont
 
 	// Resolve and store declared output mappings
 	if step.Output != nil {
-		dpPlugin, _ := s.plugins.Get("default")
-		dp, isDef := dpPlugin.(*DefaultPlugin)
+		dp, isDef := plugins.templates()
 		for outputKey, outputTemplate := range step.Output {
 			if isDef {
 				resolvedValue := dp.ResolveTemplates(outputTemplate, ctx)
 				ctx.SetStepData(step.Name, outputKey, resolvedValue)
-				log.Printf("    Output: %s = %v", outputKey, resolvedValue)
+				logging.Debugf("    Output: %s = %v", outputKey, resolvedValue)
 			}
 		}
 	}
@@ -377,19 +427,17 @@ func (s *Service) executeStep(step models.PipelineStep, ctx *models.PipelineCont
 
 // executeForEach iterates over a resolved array and runs the for_each sub-steps
 // for each element. Returns the number of items processed.
-func (s *Service) executeForEach(step models.PipelineStep, execution *models.PipelineExecution, allSteps []models.PipelineStep) (int, error) {
+func (s *Service) executeForEach(step models.PipelineStep, execution *models.PipelineExecution, plugins pluginTable) (int, error) {
 	fe := step.ForEach
 
 	// Resolve the items array. Items is a template string referencing context.
-	var items []interface{}
-	dpPlugin, ok := s.plugins.Get("default")
-	dp, ok := dpPlugin.(*DefaultPlugin)
+	dp, ok := plugins.templates()
 	if !ok {
 		return 0, fmt.Errorf("for_each requires the default plugin to be registered")
 	}
 
-	resolved := dp.ResolveTemplates(fe.Items, execution.Context)
-	if err := json.Unmarshal([]byte(resolved), &items); err != nil {
+	items, err := dp.resolveTemplateArray(fe.Items, execution.Context)
+	if err != nil {
 		return 0, fmt.Errorf("for_each items %q must resolve to a JSON array: %w", fe.Items, err)
 	}
 
@@ -407,19 +455,17 @@ func (s *Service) executeForEach(step models.PipelineStep, execution *models.Pip
 		for _, subStep := range fe.Steps {
 			if subStep.ForEach != nil {
 				// Nested for_each
-				if _, err := s.executeForEach(subStep, execution, nil); err != nil {
+				if _, err := s.executeForEach(subStep, execution, plugins); err != nil {
 					return i, fmt.Errorf("sub-step %s (iteration %d): %w", subStep.Name, i, err)
 				}
 				continue
 			}
 
-			result, gotoTarget, err := s.executeStep(subStep, execution.Context)
+			result, gotoTarget, err := s.executeStep(subStep, execution.Context, plugins)
 			if err != nil {
 				return i, fmt.Errorf("sub-step %s (iteration %d): %w", subStep.Name, i, err)
 			}
-			for key, value := range result {
-				execution.Context.SetStepData(subStep.Name, key, value)
-			}
+			execution.Context.SetStepResults(subStep.Name, result)
 			if gotoTarget != "" {
 				log.Printf("    for_each: goto inside sub-steps is not supported, ignoring target %s", gotoTarget)
 			}
@@ -517,14 +563,9 @@ func (s *Service) validatePluginAction(pluginName, action string) error {
 		}
 		return nil
 	}
-	if _, ok := s.plugins.Get(pluginName); ok {
+	if _, ok := s.lookupPlugin(pluginName); ok {
 		return nil
 	}
-	if s.pluginRegistry != nil {
-		if _, ok := s.pluginRegistry.GetPlugin(pluginName); ok {
-			return nil
-		}
-	}
 	return fmt.Errorf("unknown plugin: %s", pluginName)
 }
 
@@ -547,3 +547,39 @@ func TestPipelineDeleteRejectsReferencedPipeline(t *testing.T) {
 		t.Fatalf("expected multiple references, got %#v", inUseErr.References)
 	}
 }
+
+func TestIndexStepsPrefersFirstOccurrence(t *testing.T) {
+	index := IndexSteps([]models.PipelineStep{
+		{Name: "fetch"},
+		{Name: "loop"},
+		{Name: "fetch"},
+	})
+	if index["fetch"] != 0 {
+		t.Fatalf("expected first fetch step at 0, got %d", index["fetch"])
+	}
+	if index["loop"] != 1 {
+		t.Fatalf("expected loop step at 1, got %d", index["loop"])
+	}
+	if _, ok := index["missing"]; ok {
+		t.Fatal("expected missing step to be absent")
+	}
+}
+
+func TestResolveTemplateArrayCopiesContextArray(t *testing.T) {
+	ctx := models.NewPipelineContext(0)
+	stored := []interface{}{"a", "b"}
+	ctx.SetStepData("fetch", "items", stored)
+
+	items, err := NewDefaultPlugin().resolveTemplateArray("{{context.fetch.items}}", ctx)
+	if err != nil {
+		t.Fatalf("resolveTemplateArray returned error: %v", err)
+	}
+	if len(items) != 2 || items[0] != "a" || items[1] != "b" {
+		t.Fatalf("expected [a b], got %v", items)
+	}
+
+	items[0] = "changed"
+	if stored[0] != "a" {
+		t.Fatalf("expected stored context array to be unchanged, got %v", stored)
+	}
+}
@@ -1,46 +1,72 @@
 package pluginruntime
 
-import "sync"
+import (
+	"sync"
+	"sync/atomic"
+)
 
-// Registry is a threadsafe named registry for runtime extensions.
+// Registry is a threadsafe named registry for runtime extensions. Lookups read
+// an immutable snapshot without locking; writers copy the snapshot, apply their
+// change and publish the new map, which suits registries that are read on every
+// request but only change when extensions are installed or removed.
 type Registry[T any] struct {
-	mu    sync.RWMutex
-	items map[string]T
+	mu    sync.Mutex // serialises writers
+	items atomic.Pointer[map[string]T]
 }
 
 // NewRegistry creates an empty registry.
 func NewRegistry[T any]() *Registry[T] {
-	return &Registry[T]{items: make(map[string]T)}
+	r := &Registry[T]{}
+	items := make(map[string]T)
+	r.items.Store(&items)
+	return r
 }
 
-// Register stores an item under name.
-func (r *Registry[T]) Register(name string, item T) {
+func (r *Registry[T]) snapshot() map[string]T {
+	if items := r.items.Load(); items != nil {
+		return *items
+	}
+	return nil
+}
+
+// update publishes a copy of the current items after applying change to it.
+func (r *Registry[T]) update(change func(items map[string]T)) {
 	r.mu.Lock()
 	defer r.mu.Unlock()
-	r.items[name] = item
+	current := r.snapshot()
+	next := make(map[string]T, len(current)+1)
+	for name, item := range current {
+		next[name] = item
+	}
+	change(next)
+	r.items.Store(&next)
+}
+
+// Register stores an item under name.
+func (r *Registry[T]) Register(name string, item T) {
+	r.update(func(items map[string]T) {
+		items[name] = item
+	})
 }
 
 // Get returns the item registered under name.
 func (r *Registry[T]) Get(name string) (T, bool) {
-	r.mu.RLock()
-	defer r.mu.RUnlock()
-	item, ok := r.items[name]
+	item, ok := r.snapshot()[name]
 	return item, ok
 }
 
 // Delete removes an item from the registry.
 func (r *Registry[T]) Delete(name string) {
-	r.mu.Lock()
-	defer r.mu.Unlock()
-	delete(r.items, name)
+	r.update(func(items map[string]T) {
+		delete(items, name)
+	})
 }
 
 // Names returns a snapshot of all registered names.
 func (r *Registry[T]) Names() []string {
-	r.mu.RLock()
-	defer r.mu.RUnlock()
-	names := make([]string, 0, len(r.items))
-	for name := range r.items {
+	items := r.snapshot()
+	names := make([]string, 0, len(items))
+	for name := range items {
 		names = append(names, name)
 	}
 	return names
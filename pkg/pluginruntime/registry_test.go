@@ -0,0 +1,58 @@
+package pluginruntime
+
+import (
+	"fmt"
+	"sync"
+	"testing"
+)
+
+func TestRegistryConcurrentReadsAndWrites(t *testing.T) {
+	r := NewRegistry[int]()
+	r.Register("base", 1)
+
+	var wg sync.WaitGroup
+	for i := 0; i < 4; i++ {
+		wg.Add(2)
+		go func(i int) {
+			defer wg.Done()
+			for j := 0; j < 100; j++ {
+				name := fmt.Sprintf("item-%d-%d", i, j)
+				r.Register(name, j)
+				r.Delete(name)
+			}
+		}(i)
+		go func() {
+			defer wg.Done()
+			for j := 0; j < 100; j++ {
+				if item, ok := r.Get("base"); !ok || item != 1 {
+					t.Errorf("expected base item 1, got %d (found=%v)", item, ok)
+					return
+				}
+				_ = r.Names()
+			}
+		}()
+	}
+	wg.Wait()
+
+	if names := r.Names(); len(names) != 1 || names[0] != "base" {
+		t.Fatalf("expected only base to remain, got %v", names)
+	}
+}
+
+func TestRegistrySnapshotIsolation(t *testing.T) {
+	r := NewRegistry[string]()
+	r.Register("a", "first")
+	names := r.Names()
+	r.Register("b", "second")
+	r.Delete("a")
+
+	if len(names) != 1 || names[0] != "a" {
+		t.Fatalf("expected earlier snapshot to be unaffected, got %v", names)
+	}
+	if _, ok := r.Get("a"); ok {
+		t.Fatal("expected a to be deleted")
+	}
+	if item, ok := r.Get("b"); !ok || item != "second" {
+		t.Fatalf("expected b=second, got %q (found=%v)", item, ok)
+	}
+}
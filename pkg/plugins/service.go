@@ -1,7 +1,9 @@
 package plugins
 
 import (
+	"errors"
 	"fmt"
+	"io"
 	"log"
 	"os"
 	"os/exec"
@@ -325,13 +327,16 @@ func (s *Service) getCommitHash(repoDir string) (string, error) {
 
 // parsePluginDefinition parses the plugin.yaml file
 func (s *Service) parsePluginDefinition(path string) (*models.PluginDefinition, error) {
-	data, err := os.ReadFile(path)
+	file, err := os.Open(path)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read plugin.yaml: %w", err)
 	}
+	defer file.Close()
 
+	// An empty file decodes to io.EOF; treat it like yaml.Unmarshal does and let
+	// validation report the missing fields.
 	var def models.PluginDefinition
-	if err := yaml.Unmarshal(data, &def); err != nil {
+	if err := yaml.NewDecoder(file).Decode(&def); err != nil && !errors.Is(err, io.EOF) {
 		return nil, fmt.Errorf("failed to parse plugin.yaml: %w", err)
 	}
 
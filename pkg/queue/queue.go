@@ -22,6 +22,7 @@ type Queue struct {
 	pq        *PriorityQueue
 	workTasks map[string]*models.WorkTask
 	listeners []WorkTaskListener
+	ready     chan struct{}
 }
 
 // Snapshot summarizes queue depth and known task counts for health/metrics surfaces.
@@ -42,6 +43,7 @@ func NewQueue(store metadatastore.MetadataStore) (*Queue, error) {
 		pq:        &pq,
 		workTasks: make(map[string]*models.WorkTask),
 		listeners: make([]WorkTaskListener, 0),
+		ready:     make(chan struct{}, 1),
 	}
 	if err := q.loadPersistedTasks(); err != nil {
 		return nil, err
@@ -120,9 +122,24 @@ func (q *Queue) Enqueue(task *models.WorkTask) error {
 	}
 	heap.Push(q.pq, &PriorityQueueItem{TaskID: queuedTask.ID, Priority: priorityScore(queuedTask, queuedTask.SubmittedAt)})
 	q.workTasks[queuedTask.ID] = queuedTask
+	q.signalReady()
 	return nil
 }
 
+// Ready returns a channel that receives a value whenever a task is pushed onto the queue.
+// Signals coalesce: a dispatcher that drains the queue after each receive never misses work.
+func (q *Queue) Ready() <-chan struct{} {
+	return q.ready
+}
+
+// signalReady wakes a waiting dispatcher without blocking when a wake-up is already pending.
+func (q *Queue) signalReady() {
+	select {
+	case q.ready <- struct{}{}:
+	default:
+	}
+}
+
 // Dequeue retrieves the next work task from the queue and marks it spawned.
 func (q *Queue) Dequeue() (*models.WorkTask, error) {
 	q.mu.Lock()
@@ -387,6 +404,7 @@ func (q *Queue) RequeueWithRetry(taskID string, reason string) error {
 			return err
 		}
 		heap.Push(q.pq, &PriorityQueueItem{TaskID: task.ID, Priority: priorityScore(task, time.Now().UTC().Add(time.Duration(task.RetryCount)*time.Minute))})
+		q.signalReady()
 		taskSnapshot := cloneWorkTask(task)
 		listeners := append([]WorkTaskListener(nil), q.listeners...)
 		q.mu.Unlock()
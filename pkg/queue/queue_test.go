@@ -60,6 +60,36 @@ func TestEnqueueDequeue(t *testing.T) {
 
 }
 
+func TestEnqueueSignalsReady(t *testing.T) {
+	q, err := NewQueue(nil)
+	if err != nil {
+		t.Fatalf("Failed to create queue: %v", err)
+	}
+
+	select {
+	case <-q.Ready():
+		t.Fatal("expected no ready signal before enqueue")
+	default:
+	}
+
+	for _, id := range []string{"ready-1", "ready-2"} {
+		if err := q.Enqueue(&models.WorkTask{ID: id, Type: models.WorkTaskTypePipelineExecution, Priority: 1}); err != nil {
+			t.Fatalf("Failed to enqueue task: %v", err)
+		}
+	}
+
+	select {
+	case <-q.Ready():
+	default:
+		t.Fatal("expected ready signal after enqueue")
+	}
+	select {
+	case <-q.Ready():
+		t.Fatal("expected pending ready signals to coalesce")
+	default:
+	}
+}
+
 // TestQueueLength tests queue length tracking
 func TestQueueLength(t *testing.T) {
 	q, err := NewQueue(nil)
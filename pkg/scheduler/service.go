@@ -9,6 +9,7 @@ import (
 	"github.com/google/uuid"
 	"github.com/robfig/cron/v3"
 
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	"github.com/mimir-aip/mimir-aip-go/pkg/metadatastore"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
 	"github.com/mimir-aip/mimir-aip-go/pkg/pipeline"
@@ -23,8 +24,14 @@ type Service struct {
 	cron            *cron.Cron
 	jobsMu          sync.RWMutex
 	jobs            map[string]cron.EntryID // Maps job ID to cron entry ID
+	schedulesMu     sync.Mutex
+	schedules       map[string]cron.Schedule // Parsed schedules keyed by cron expression
 }
 
+// maxCachedSchedules bounds the parsed-schedule cache; expressions beyond it are
+// parsed on demand.
+const maxCachedSchedules = 256
+
 // NewService creates a new scheduler service
 func NewService(store metadatastore.MetadataStore, pipelineService *pipeline.Service, q *queue.Queue) *Service {
 	return &Service{
@@ -33,6 +40,7 @@ func NewService(store metadatastore.MetadataStore, pipelineService *pipeline.Ser
 		queue:           q,
 		cron:            cron.New(),
 		jobs:            make(map[string]cron.EntryID),
+		schedules:       make(map[string]cron.Schedule),
 	}
 }
 
@@ -84,7 +92,7 @@ func (s *Service) Create(req *models.ScheduleCreateRequest) (*models.Schedule, e
 
 	// Calculate next run time
 	if job.Enabled {
-		schedule, err := cron.ParseStandard(job.CronSchedule)
+		schedule, err := s.parseSchedule(job.CronSchedule)
 		if err == nil {
 			nextRun := schedule.Next(time.Now())
 			job.NextRun = &nextRun
@@ -190,6 +198,25 @@ func (s *Service) deleteJobEntry(jobID string) {
 	delete(s.jobs, jobID)
 }
 
+// parseSchedule parses a standard cron expression, reusing the result for
+// expressions seen before. Parsed schedules are read-only, so one value can back
+// every job that shares an expression.
+func (s *Service) parseSchedule(expr string) (cron.Schedule, error) {
+	s.schedulesMu.Lock()
+	defer s.schedulesMu.Unlock()
+	if schedule, ok := s.schedules[expr]; ok {
+		return schedule, nil
+	}
+	schedule, err := cron.ParseStandard(expr)
+	if err != nil {
+		return nil, err
+	}
+	if len(s.schedules) < maxCachedSchedules {
+		s.schedules[expr] = schedule
+	}
+	return schedule, nil
+}
+
 func cloneSchedule(job *models.Schedule) *models.Schedule {
 	if job == nil {
 		return nil
@@ -220,7 +247,7 @@ func (s *Service) applyUpdate(job *models.Schedule, req *models.ScheduleUpdateRe
 		job.Pipelines = append([]string(nil), (*req.Pipelines)...)
 	}
 	if req.CronSchedule != nil {
-		if _, err := cron.ParseStandard(*req.CronSchedule); err != nil {
+		if _, err := s.parseSchedule(*req.CronSchedule); err != nil {
 			return fmt.Errorf("invalid cron expression: %w", err)
 		}
 		job.CronSchedule = *req.CronSchedule
@@ -236,7 +263,7 @@ func (s *Service) refreshNextRun(job *models.Schedule) error {
 		job.NextRun = nil
 		return nil
 	}
-	schedule, err := cron.ParseStandard(job.CronSchedule)
+	schedule, err := s.parseSchedule(job.CronSchedule)
 	if err != nil {
 		return fmt.Errorf("invalid cron expression: %w", err)
 	}
@@ -248,14 +275,15 @@ func (s *Service) refreshNextRun(job *models.Schedule) error {
 // scheduleJob schedules a job with the cron scheduler
 func (s *Service) scheduleJob(job *models.Schedule) error {
 	// Parse cron expression
-	schedule, err := cron.ParseStandard(job.CronSchedule)
+	schedule, err := s.parseSchedule(job.CronSchedule)
 	if err != nil {
 		return fmt.Errorf("invalid cron expression: %w", err)
 	}
 
-	// Create job function
+	// Create job function; the parsed schedule is reused to compute each next run
 	jobFunc := func() {
-		s.executeJob(job)
+		defer logging.CloseOnPanic()
+		s.executeJob(job, schedule)
 	}
 
 	// Add to cron scheduler
@@ -268,19 +296,14 @@ func (s *Service) scheduleJob(job *models.Schedule) error {
 }
 
 // executeJob executes a scheduled job by creating WorkTasks for each pipeline
-func (s *Service) executeJob(job *models.Schedule) {
+func (s *Service) executeJob(job *models.Schedule, schedule cron.Schedule) {
 	log.Printf("Executing scheduled job: %s", job.Name)
 
-	// Update last run time
+	// Update last and next run times
 	now := time.Now()
 	job.LastRun = &now
-
-	// Calculate next run time
-	schedule, err := cron.ParseStandard(job.CronSchedule)
-	if err == nil {
-		nextRun := schedule.Next(now)
-		job.NextRun = &nextRun
-	}
+	nextRun := schedule.Next(now)
+	job.NextRun = &nextRun
 
 	// Save updated job
 	if err := s.store.SaveSchedule(job); err != nil {
@@ -332,7 +355,7 @@ func (s *Service) executeJob(job *models.Schedule) {
 		}
 
 		workTaskIDs = append(workTaskIDs, workTask.ID)
-		log.Printf("  Queued WorkTask %s for pipeline %s", workTask.ID, pipelineID)
+		logging.Debugf("  Queued WorkTask %s for pipeline %s", workTask.ID, pipelineID)
 	}
 
 	log.Printf("Scheduled job %s completed. Queued %d work tasks", job.Name, len(workTaskIDs))
@@ -358,7 +381,7 @@ func (s *Service) validateCreateRequest(req *models.ScheduleCreateRequest) error
 	}
 
 	// Validate cron expression
-	if _, err := cron.ParseStandard(req.CronSchedule); err != nil {
+	if _, err := s.parseSchedule(req.CronSchedule); err != nil {
 		return fmt.Errorf("invalid cron expression: %w", err)
 	}
 
@@ -5,6 +5,8 @@ import (
 	"testing"
 	"time"
 
+	"github.com/robfig/cron/v3"
+
 	"github.com/mimir-aip/mimir-aip-go/pkg/metadatastore"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
 	"github.com/mimir-aip/mimir-aip-go/pkg/pipeline"
@@ -163,7 +165,14 @@ func TestExecuteJobQueuesScheduledWorkTasks(t *testing.T) {
 		t.Fatalf("failed to save schedule: %v", err)
 	}
 
-	svc.executeJob(job)
+	schedule, err := cron.ParseStandard(job.CronSchedule)
+	if err != nil {
+		t.Fatalf("failed to parse schedule: %v", err)
+	}
+	svc.executeJob(job, schedule)
+	if job.NextRun == nil || !job.NextRun.After(*job.LastRun) {
+		t.Fatalf("expected next_run after last_run, got last=%v next=%v", job.LastRun, job.NextRun)
+	}
 
 	tasks, err := svc.queue.ListWorkTasks()
 	if err != nil {
@@ -183,3 +192,25 @@ func TestExecuteJobQueuesScheduledWorkTasks(t *testing.T) {
 		t.Fatalf("expected triggered_by %s, got %#v", job.ID, task.TaskSpec.Parameters["triggered_by"])
 	}
 }
+
+func TestParseScheduleReusesParsedExpressions(t *testing.T) {
+	svc := NewService(nil, nil, nil)
+
+	first, err := svc.parseSchedule("*/5 * * * *")
+	if err != nil {
+		t.Fatalf("failed to parse schedule: %v", err)
+	}
+	second, err := svc.parseSchedule("*/5 * * * *")
+	if err != nil {
+		t.Fatalf("failed to parse schedule: %v", err)
+	}
+	if first != second {
+		t.Fatal("expected the parsed schedule to be reused")
+	}
+	if _, err := svc.parseSchedule("not a cron"); err == nil {
+		t.Fatal("expected invalid expression to fail")
+	}
+	if len(svc.schedules) != 1 {
+		t.Fatalf("expected only valid expressions to be cached, got %d", len(svc.schedules))
+	}
+}
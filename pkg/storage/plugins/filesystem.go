@@ -1,18 +1,59 @@
 package plugins
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"io/ioutil"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
 
 	"github.com/google/uuid"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
 	"github.com/mimir-aip/mimir-aip-go/pkg/storage"
 )
 
+// maxPooledBuffer caps the capacity of item buffers returned to the pool so
+// a single oversized item does not pin a large allocation for the process lifetime.
+const maxPooledBuffer = 8 << 20
+
+// minParallelDecode is the window size at or below which Retrieve decodes
+// sequentially, since goroutine hand-off would outweigh the work.
+const minParallelDecode = 8
+
+var itemBufferPool = sync.Pool{
+	New: func() interface{} { return new(bytes.Buffer) },
+}
+
+func getItemBuffer() *bytes.Buffer {
+	buf := itemBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+func putItemBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBuffer {
+		itemBufferPool.Put(buf)
+	}
+}
+
+// readItemFile reads path into buf, replacing its previous contents. It is a
+// variable so tests can count the item files a query reads.
+var readItemFile = func(path string, buf *bytes.Buffer) error {
+	file, err := os.Open(path)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	buf.Reset()
+	_, err = buf.ReadFrom(file)
+	return err
+}
+
 // FilesystemPlugin implements the StoragePlugin interface for local filesystem storage
 type FilesystemPlugin struct {
 	basePath    string
@@ -134,14 +175,16 @@ func (f *FilesystemPlugin) storeItem(entityDir string, cir *models.CIR) error {
 	filename := fmt.Sprintf("%s.json", itemID)
 	filePath := filepath.Join(entityDir, filename)
 
-	// Marshal CIR to JSON
-	data, err := json.MarshalIndent(cir, "", "  ")
-	if err != nil {
+	// Marshal CIR to compact JSON in a pooled buffer
+	buf := getItemBuffer()
+	defer putItemBuffer(buf)
+
+	if err := json.NewEncoder(buf).Encode(cir); err != nil {
 		return fmt.Errorf("failed to marshal CIR: %w", err)
 	}
 
 	// Write to file
-	if err := ioutil.WriteFile(filePath, data, 0644); err != nil {
+	if err := ioutil.WriteFile(filePath, buf.Bytes(), 0644); err != nil {
 		return fmt.Errorf("failed to write file: %w", err)
 	}
 
@@ -173,50 +216,142 @@ func (f *FilesystemPlugin) Retrieve(query *models.CIRQuery) ([]*models.CIR, erro
 	}
 
 	// Read all files in the entity directory
-	files, err := ioutil.ReadDir(entityDir)
+	entries, err := os.ReadDir(entityDir)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read entity directory: %w", err)
 	}
 
+	paths := make([]string, 0, len(entries))
+	for _, entry := range entries {
+		if entry.IsDir() || !strings.HasSuffix(entry.Name(), ".json") {
+			continue
+		}
+		paths = append(paths, filepath.Join(entityDir, entry.Name()))
+	}
+
 	results := make([]*models.CIR, 0)
 	matched := 0
 	offset := query.Offset
 	limit := query.Limit
 
-	for _, file := range files {
-		if file.IsDir() || !strings.HasSuffix(file.Name(), ".json") {
-			continue
+	// Decode files in windows that are parsed in parallel. A limited query never
+	// reads more files than it still needs matches, so it stops reading as soon
+	// as it has enough.
+	window := retrieveWindowSize(len(paths))
+	decoded := make([]*models.CIR, window)
+	headers := make(stringInterner)
+	for start := 0; start < len(paths); {
+		size := window
+		if limit > 0 {
+			size = min(size, offset+limit-matched)
 		}
+		batch := paths[start:min(start+size, len(paths))]
+		start += len(batch)
+		f.decodeMatching(batch, query.Filters, decoded[:len(batch)])
 
-		filePath := filepath.Join(entityDir, file.Name())
-		data, err := ioutil.ReadFile(filePath)
-		if err != nil {
-			continue // Skip files that can't be read
-		}
+		for _, cir := range decoded[:len(batch)] {
+			if cir == nil {
+				continue
+			}
 
-		var cir models.CIR
-		if err := json.Unmarshal(data, &cir); err != nil {
-			continue // Skip invalid JSON
+			if matched < offset {
+				matched++
+				continue
+			}
+
+			headers.internSource(cir)
+			results = append(results, cir)
+			matched++
+
+			if limit > 0 && len(results) >= limit {
+				return results, nil
+			}
 		}
+	}
 
-		if !f.matchesFilters(&cir, query.Filters) {
-			continue
+	return results, nil
+}
+
+// stringInterner deduplicates strings within a single result set.
+type stringInterner map[string]string
+
+func (in stringInterner) intern(s string) string {
+	if canonical, ok := in[s]; ok {
+		return canonical
+	}
+	in[s] = s
+	return s
+}
+
+// internSource shares the version and source header strings, which are
+// usually identical across every item of an entity type, so a large result
+// holds one copy of each instead of one per decoded item.
+func (in stringInterner) internSource(cir *models.CIR) {
+	cir.Version = in.intern(cir.Version)
+	cir.Source.Type = models.SourceType(in.intern(string(cir.Source.Type)))
+	cir.Source.URI = in.intern(cir.Source.URI)
+	cir.Source.Format = models.DataFormat(in.intern(string(cir.Source.Format)))
+}
+
+// retrieveWindowSize returns how many files Retrieve decodes per parallel window.
+func retrieveWindowSize(total int) int {
+	window := runtime.GOMAXPROCS(0) * 16
+	if total < window {
+		window = total
+	}
+	return max(window, 1)
+}
+
+// decodeMatching reads and decodes paths concurrently, writing each item that
+// matches filters into the slot at the same index. Unreadable files, invalid
+// JSON and non-matching items leave a nil slot. Each worker reads through one
+// pooled buffer; decoding copies everything it keeps, so the buffer is reused.
+func (f *FilesystemPlugin) decodeMatching(paths []string, filters []models.CIRCondition, out []*models.CIR) {
+	decode := func(i int, buf *bytes.Buffer) {
+		out[i] = nil
+		if err := readItemFile(paths[i], buf); err != nil {
+			return // Skip files that can't be read
 		}
 
-		if matched < offset {
-			matched++
-			continue
+		var cir models.CIR
+		if err := json.Unmarshal(buf.Bytes(), &cir); err != nil {
+			return // Skip invalid JSON
 		}
 
-		results = append(results, &cir)
-		matched++
+		if f.matchesFilters(&cir, filters) {
+			out[i] = &cir
+		}
+	}
 
-		if limit > 0 && len(results) >= limit {
-			break
+	if len(paths) <= minParallelDecode {
+		buf := getItemBuffer()
+		defer putItemBuffer(buf)
+		for i := range paths {
+			decode(i, buf)
 		}
+		return
 	}
 
-	return results, nil
+	workers := min(runtime.GOMAXPROCS(0), len(paths))
+	next := make(chan int, len(paths))
+	for i := range paths {
+		next <- i
+	}
+	close(next)
+
+	var wg sync.WaitGroup
+	wg.Add(workers)
+	for w := 0; w < workers; w++ {
+		go func() {
+			defer wg.Done()
+			buf := getItemBuffer()
+			defer putItemBuffer(buf)
+			for i := range next {
+				decode(i, buf)
+			}
+		}()
+	}
+	wg.Wait()
 }
 
 // matchesFilters checks if a CIR object matches the query filters
@@ -311,7 +446,10 @@ func (f *FilesystemPlugin) Update(query *models.CIRQuery, updates *models.CIRUpd
 	}, nil
 }
 
-// Delete deletes CIR data from the filesystem
+// Delete deletes CIR data from the filesystem. Filtered deletes decode each item
+// and skip files that cannot be read or parsed; an unfiltered delete removes every
+// .json item file in the entity directory without reading it, including
+// unreadable or corrupt ones, and counts them in AffectedItems.
 func (f *FilesystemPlugin) Delete(query *models.CIRQuery) (*models.StorageResult, error) {
 	if !f.initialized {
 		return nil, fmt.Errorf("plugin not initialized")
@@ -331,36 +469,43 @@ func (f *FilesystemPlugin) Delete(query *models.CIRQuery) (*models.StorageResult
 	}
 
 	// Read all files in the entity directory
-	files, err := ioutil.ReadDir(entityDir)
+	entries, err := os.ReadDir(entityDir)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read entity directory: %w", err)
 	}
 
 	affectedItems := 0
+	unfiltered := len(query.Filters) == 0
 
-	for _, file := range files {
-		if file.IsDir() || !strings.HasSuffix(file.Name(), ".json") {
+	for _, entry := range entries {
+		if entry.IsDir() || !strings.HasSuffix(entry.Name(), ".json") {
 			continue
 		}
 
-		filePath := filepath.Join(entityDir, file.Name())
-		data, err := ioutil.ReadFile(filePath)
-		if err != nil {
-			continue
-		}
+		filePath := filepath.Join(entityDir, entry.Name())
 
-		var cir models.CIR
-		if err := json.Unmarshal(data, &cir); err != nil {
-			continue
-		}
+		// Without filters every item matches, so skip reading and decoding it.
+		if !unfiltered {
+			data, err := ioutil.ReadFile(filePath)
+			if err != nil {
+				continue
+			}
 
-		// Check if matches filters
-		if f.matchesFilters(&cir, query.Filters) {
-			if err := os.Remove(filePath); err != nil {
+			var cir models.CIR
+			if err := json.Unmarshal(data, &cir); err != nil {
+				continue
+			}
+
+			// Check if matches filters
+			if !f.matchesFilters(&cir, query.Filters) {
 				continue
 			}
-			affectedItems++
 		}
+
+		if err := os.Remove(filePath); err != nil {
+			continue
+		}
+		affectedItems++
 	}
 
 	return &models.StorageResult{
@@ -1,7 +1,9 @@
 package plugins
 
 import (
+	"bytes"
 	"fmt"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -69,3 +71,37 @@ func BenchmarkFilesystemRetrieve(b *testing.B) {
 		}
 	}
 }
+
+func TestFilesystemRetrieveLimitReadsOnlyNeededFiles(t *testing.T) {
+	plugin := NewFilesystemPlugin()
+	if err := plugin.Initialize(&models.PluginConfig{Options: map[string]interface{}{"base_path": t.TempDir()}}); err != nil {
+		t.Fatalf("Initialize failed: %v", err)
+	}
+	for i := 0; i < 200; i++ {
+		if _, err := plugin.Store(benchmarkCIR(i)); err != nil {
+			t.Fatalf("prefill store failed: %v", err)
+		}
+	}
+
+	var reads atomic.Int32
+	original := readItemFile
+	readItemFile = func(path string, buf *bytes.Buffer) error {
+		reads.Add(1)
+		return original(path, buf)
+	}
+	defer func() { readItemFile = original }()
+
+	for _, tc := range []struct{ offset, limit int }{{0, 1}, {2, 3}} {
+		reads.Store(0)
+		results, err := plugin.Retrieve(&models.CIRQuery{EntityType: "SensorReading", Offset: tc.offset, Limit: tc.limit})
+		if err != nil {
+			t.Fatalf("Retrieve failed: %v", err)
+		}
+		if len(results) != tc.limit {
+			t.Fatalf("expected %d results, got %d", tc.limit, len(results))
+		}
+		if got, want := int(reads.Load()), tc.offset+tc.limit; got != want {
+			t.Fatalf("offset %d limit %d: expected %d file reads, got %d", tc.offset, tc.limit, want, got)
+		}
+	}
+}
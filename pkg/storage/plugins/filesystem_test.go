@@ -3,6 +3,7 @@ package plugins_test
 import (
 	"io/ioutil"
 	"os"
+	"path/filepath"
 	"testing"
 
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
@@ -224,3 +225,85 @@ func TestFilesystemPluginGetMetadata(t *testing.T) {
 		t.Error("Expected capabilities to be listed")
 	}
 }
+
+func TestFilesystemPluginDeleteWithoutFilters(t *testing.T) {
+	tempDir := t.TempDir()
+
+	plugin := plugins.NewFilesystemPlugin()
+	if err := plugin.Initialize(&models.PluginConfig{ConnectionString: tempDir}); err != nil {
+		t.Fatalf("Failed to initialize plugin: %v", err)
+	}
+
+	cir := models.NewCIR(models.SourceTypeAPI, "https://example.com/employees", models.DataFormatJSON, []interface{}{
+		map[string]interface{}{"id": "1"},
+		map[string]interface{}{"id": "2"},
+		map[string]interface{}{"id": "3"},
+	})
+	if _, err := plugin.Store(cir); err != nil {
+		t.Fatalf("Failed to store data: %v", err)
+	}
+
+	query := &models.CIRQuery{EntityType: "default"}
+	deleteResult, err := plugin.Delete(query)
+	if err != nil {
+		t.Fatalf("Failed to delete data: %v", err)
+	}
+	if deleteResult.AffectedItems != 3 {
+		t.Errorf("Expected 3 deleted items, got %d", deleteResult.AffectedItems)
+	}
+
+	remaining, err := plugin.Retrieve(query)
+	if err != nil {
+		t.Fatalf("Failed to retrieve after delete: %v", err)
+	}
+	if len(remaining) != 0 {
+		t.Errorf("Expected 0 results after deletion, got %d", len(remaining))
+	}
+}
+
+func TestFilesystemPluginDeleteUnreadableItems(t *testing.T) {
+	tempDir := t.TempDir()
+
+	plugin := plugins.NewFilesystemPlugin()
+	if err := plugin.Initialize(&models.PluginConfig{ConnectionString: tempDir}); err != nil {
+		t.Fatalf("Failed to initialize plugin: %v", err)
+	}
+
+	cir := models.NewCIR(models.SourceTypeAPI, "https://example.com/employees", models.DataFormatJSON, []interface{}{
+		map[string]interface{}{"id": "1"},
+	})
+	if _, err := plugin.Store(cir); err != nil {
+		t.Fatalf("Failed to store data: %v", err)
+	}
+	corrupt := filepath.Join(tempDir, "default", "corrupt.json")
+	if err := os.WriteFile(corrupt, []byte("{not json"), 0644); err != nil {
+		t.Fatalf("Failed to write corrupt item: %v", err)
+	}
+
+	// Filtered deletes must decode an item to match it, so corrupt files are skipped.
+	filtered, err := plugin.Delete(&models.CIRQuery{
+		EntityType: "default",
+		Filters:    []models.CIRCondition{{Attribute: "id", Operator: "eq", Value: "missing"}},
+	})
+	if err != nil {
+		t.Fatalf("Failed filtered delete: %v", err)
+	}
+	if filtered.AffectedItems != 0 {
+		t.Errorf("Expected 0 deleted items, got %d", filtered.AffectedItems)
+	}
+	if _, err := os.Stat(corrupt); err != nil {
+		t.Fatalf("Expected corrupt item to survive a filtered delete: %v", err)
+	}
+
+	// An unfiltered delete clears every item file, readable or not.
+	all, err := plugin.Delete(&models.CIRQuery{EntityType: "default"})
+	if err != nil {
+		t.Fatalf("Failed unfiltered delete: %v", err)
+	}
+	if all.AffectedItems != 2 {
+		t.Errorf("Expected 2 deleted items, got %d", all.AffectedItems)
+	}
+	if _, err := os.Stat(corrupt); !os.IsNotExist(err) {
+		t.Errorf("Expected corrupt item to be removed, stat returned %v", err)
+	}
+}
@@ -1,6 +1,7 @@
 package workexec
 
 import (
+	"bufio"
 	"bytes"
 	"encoding/base64"
 	"encoding/json"
@@ -14,11 +15,11 @@ import (
 	"strconv"
 	"time"
 
+	"github.com/mimir-aip/mimir-aip-go/pkg/logging"
 	"github.com/mimir-aip/mimir-aip-go/pkg/mlmodel"
 	"github.com/mimir-aip/mimir-aip-go/pkg/mlmodel/training"
 	"github.com/mimir-aip/mimir-aip-go/pkg/models"
 	pipelinepkg "github.com/mimir-aip/mimir-aip-go/pkg/pipeline"
-	"github.com/mimir-aip/mimir-aip-go/pkg/pluginruntime"
 	"github.com/mimir-aip/mimir-aip-go/pkg/plugins"
 )
 
@@ -132,6 +133,28 @@ func fetchModelWithOwnership(orchestratorURL, projectID, modelID string) (*model
 	return &model, nil
 }
 
+// writeContextFile streams the final pipeline context to path through a buffered
+// encoder, so a large context is never held as a second, fully marshalled copy.
+// A partially written file is removed on failure.
+func writeContextFile(path string, steps map[string]map[string]interface{}) error {
+	file, err := os.OpenFile(path, os.O_CREATE|os.O_WRONLY|os.O_TRUNC, 0644)
+	if err != nil {
+		return err
+	}
+	writer := bufio.NewWriter(file)
+	err = json.NewEncoder(writer).Encode(steps)
+	if err == nil {
+		err = writer.Flush()
+	}
+	if closeErr := file.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		_ = os.Remove(path)
+	}
+	return err
+}
+
 // executePipeline executes a pipeline work task
 func executePipeline(task *models.WorkTask) (*models.WorkTaskResult, error) {
 	log.Printf("Executing pipeline: %s", task.TaskSpec.PipelineID)
@@ -170,11 +193,15 @@ func executePipeline(task *models.WorkTask) (*models.WorkTaskResult, error) {
 	pluginCacheDir := "/tmp/plugins"
 	pluginClient := plugins.NewClient(orchestratorURL, pluginCacheDir)
 
-	pluginRegistry := pluginruntime.NewRegistry[pipelinepkg.Plugin]()
+	// The plugin set is fixed for the whole run, so steps look plugins up in a
+	// plain map that is only written before the step loop starts.
 	storageClient := pipelinepkg.NewHTTPStorageClient(orchestratorURL)
 	checkpointClient := pipelinepkg.NewHTTPCheckpointStore(orchestratorURL)
-	pluginRegistry.Register("default", pipelinepkg.NewDefaultPluginWithDeps(storageClient, checkpointClient))
-	pluginRegistry.Register("builtin", pipelinepkg.NewDefaultPluginWithDeps(storageClient, checkpointClient))
+	defaultPlugin := pipelinepkg.NewDefaultPluginWithDeps(storageClient, checkpointClient)
+	stepPlugins := map[string]pipelinepkg.Plugin{
+		"default": defaultPlugin,
+		"builtin": defaultPlugin,
+	}
 
 	uniquePlugins := make(map[string]bool)
 	for _, step := range pipeline.Steps {
@@ -196,13 +223,14 @@ func executePipeline(task *models.WorkTask) (*models.WorkTaskResult, error) {
 			return nil, fmt.Errorf("failed to load plugin %s: %w", pluginName, err)
 		}
 
-		pluginRegistry.Register(pluginName, pluginInstance)
+		stepPlugins[pluginName] = pluginInstance
 		log.Printf("Loaded custom plugin: %s", pluginName)
 	}
 
 	startTime := time.Now()
 	currentStepIndex := 0
 	stepsExecuted := 0
+	var stepIndex map[string]int
 
 	for currentStepIndex < len(pipeline.Steps) {
 		step := pipeline.Steps[currentStepIndex]
@@ -210,7 +238,7 @@ func executePipeline(task *models.WorkTask) (*models.WorkTaskResult, error) {
 
 		log.Printf("  Step %d: %s (%s.%s)", currentStepIndex+1, step.Name, step.Plugin, step.Action)
 
-		pluginInstance, ok := pluginRegistry.Get(step.Plugin)
+		pluginInstance, ok := stepPlugins[step.Plugin]
 		if !ok {
 			return nil, fmt.Errorf("unknown plugin: %s", step.Plugin)
 		}
@@ -222,30 +250,24 @@ func executePipeline(task *models.WorkTask) (*models.WorkTaskResult, error) {
 			return nil, fmt.Errorf("step %s failed: %w", step.Name, err)
 		}
 
-		for key, value := range result {
-			context.SetStepData(step.Name, key, value)
-		}
+		context.SetStepResults(step.Name, result)
 
 		if step.Output != nil {
 			for outputKey, outputTemplate := range step.Output {
 				if dp, ok := pluginInstance.(*pipelinepkg.DefaultPlugin); ok {
 					resolvedValue := dp.ResolveTemplates(outputTemplate, context)
 					context.SetStepData(step.Name, outputKey, resolvedValue)
-					log.Printf("    Output: %s = %v", outputKey, resolvedValue)
+					logging.Debugf("    Output: %s = %v", outputKey, resolvedValue)
 				}
 			}
 		}
 
 		if gotoTarget, ok := result["goto"].(string); ok {
-			targetIndex := -1
-			for i, s := range pipeline.Steps {
-				if s.Name == gotoTarget {
-					targetIndex = i
-					break
-				}
+			if stepIndex == nil {
+				stepIndex = pipelinepkg.IndexSteps(pipeline.Steps)
 			}
-
-			if targetIndex == -1 {
+			targetIndex, found := stepIndex[gotoTarget]
+			if !found {
 				return nil, fmt.Errorf("goto target not found: %s", gotoTarget)
 			}
 
@@ -265,15 +287,9 @@ func executePipeline(task *models.WorkTask) (*models.WorkTaskResult, error) {
 	if err := os.MkdirAll(outputDir, 0755); err != nil {
 		log.Printf("Warning: failed to create pipeline output dir: %v", err)
 		outputPath = ""
-	} else {
-		contextJSON, err := json.Marshal(context.Steps)
-		if err != nil {
-			log.Printf("Warning: failed to marshal pipeline context: %v", err)
-			outputPath = ""
-		} else if err := os.WriteFile(outputPath, contextJSON, 0644); err != nil {
-			log.Printf("Warning: failed to write pipeline context: %v", err)
-			outputPath = ""
-		}
+	} else if err := writeContextFile(outputPath, context.Steps); err != nil {
+		log.Printf("Warning: failed to write pipeline context: %v", err)
+		outputPath = ""
 	}
 
 	if pipelineType, ok := task.TaskSpec.Parameters["pipeline_type"].(string); ok && pipelineType == "ingestion" {
@@ -64,6 +64,13 @@ func (h *Hub) Run() {
 	}
 }
 
+// HasClients reports whether any WebSocket client is currently connected.
+func (h *Hub) HasClients() bool {
+	h.mu.RLock()
+	defer h.mu.RUnlock()
+	return len(h.clients) > 0
+}
+
 // Broadcast sends a message to all connected clients.
 func (h *Hub) Broadcast(msg []byte) {
 	h.broadcast <- msg